@@ -4,11 +4,38 @@
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
 import argparse
+import sys
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import src.config as config
 
+# Argument choices, allocated once at import
+PLATFORMS = (
+    "xhs", "dy", "ks", "bili", "wb", "tieba", "zhihu",
+    "facebook", "twitter", "instagram", "youtube"
+)
+CRAWLER_TYPES = ("search", "detail", "creator", "comments", "user_content")
+DB_TYPES = ("sqlite", "mysql", "mongodb")
+PROXY_PROVIDERS = ("none", "wandou", "kuaidl", "jishu")
+LOGIN_TYPES = ("qrcode", "mobile", "cookie", "token")
+SAVE_DATA_OPTIONS = ("json", "csv", "excel", "sqlite", "db", "mongodb")
 
-async def parse_cmd() -> argparse.Namespace:
+# Argument validation rules as (predicate, error message) pairs, checked in order
+_VALIDATIONS = (
+    (lambda a: a.crawler_type == "search" and not a.query,
+     "Search query is required for search type crawler"),
+    (lambda a: a.crawler_type in ("detail", "comments") and not a.content_id,
+     "Content ID is required for detail and comments type crawlers"),
+    (lambda a: a.crawler_type in ("creator", "user_content") and not a.user_id,
+     "User ID is required for creator and user_content type crawlers"),
+    (lambda a: a.use_proxy and a.proxy_provider == "none",
+     "Proxy provider must be specified when using proxy"),
+    (lambda a: a.use_proxy and a.proxy_provider != "none" and not a.proxy_api_key,
+     "Proxy API key is required for proxy provider"),
+)
+
+
+def parse_cmd() -> argparse.Namespace:
     """Parse command-line arguments"""
     parser = argparse.ArgumentParser(
         description="SuperCrawler - Multi-platform social media crawler",
@@ -21,10 +48,7 @@ async def parse_cmd() -> argparse.Namespace:
         "-p",
         type=str,
         default="xhs",
-        choices=[
-            "xhs", "dy", "ks", "bili", "wb", "tieba", "zhihu",
-            "facebook", "twitter", "instagram", "youtube"
-        ],
+        choices=PLATFORMS,
         help="Target platform to crawl\n"
              "xhs: Xiaohongshu\n"
              "dy: Douyin\n"
@@ -44,7 +68,7 @@ async def parse_cmd() -> argparse.Namespace:
         "-t",
         type=str,
         default="search",
-        choices=["search", "detail", "creator", "comments", "user_content"],
+        choices=CRAWLER_TYPES,
         help="Crawler type:\n"
              "search: Search for content\n"
              "detail: Get content details\n"
@@ -98,7 +122,7 @@ async def parse_cmd() -> argparse.Namespace:
         "--init-db",
         type=str,
         default=None,
-        choices=["sqlite", "mysql", "mongodb"],
+        choices=DB_TYPES,
         help="Initialize database schema\n"
              "sqlite: Initialize SQLite database\n"
              "mysql: Initialize MySQL database\n"
@@ -117,7 +141,7 @@ async def parse_cmd() -> argparse.Namespace:
         "--proxy-provider",
         type=str,
         default="none",
-        choices=["none", "wandou", "kuaidl", "jishu"],
+        choices=PROXY_PROVIDERS,
         help="Proxy provider (default: none)"
     )
     
@@ -148,7 +172,7 @@ async def parse_cmd() -> argparse.Namespace:
         "--login-type",
         type=str,
         default="cookie",
-        choices=["qrcode", "mobile", "cookie", "token"],
+        choices=LOGIN_TYPES,
         help="Login method (default: cookie)"
     )
     
@@ -179,7 +203,7 @@ async def parse_cmd() -> argparse.Namespace:
         "--save-data-option",
         type=str,
         default="json",
-        choices=["json", "csv", "excel", "sqlite", "db", "mongodb"],
+        choices=SAVE_DATA_OPTIONS,
         help="Data storage format (default: json)"
     )
     
@@ -218,91 +242,60 @@ async def parse_cmd() -> argparse.Namespace:
     args = parser.parse_args()
     
     # Update configuration based on arguments
-    await _update_config(args)
+    _update_config(args)
     
     # Validate arguments
-    await _validate_args(args)
+    _validate_args(args)
     
     return args
 
 
-async def _update_config(args: argparse.Namespace) -> None:
+def _update_config(args: argparse.Namespace) -> None:
     """Update configuration based on command-line arguments"""
-    config.base_config.PLATFORM = args.platform
-    config.base_config.SAVE_DATA_OPTION = args.save_data_option
-    config.base_config.USE_PROXY = args.use_proxy
-    config.base_config.PROXY_PROVIDER = args.proxy_provider
-    config.base_config.PROXY_API_KEY = args.proxy_api_key
-    config.base_config.HEADLESS = args.headless
-    config.base_config.USE_CDP = args.use_cdp
-    config.base_config.LOGIN_TYPE = args.login_type
-    config.base_config.REQUEST_INTERVAL = args.request_interval
-    config.base_config.MAX_REQUESTS_PER_MINUTE = args.max_requests_per_minute
-    config.base_config.DEBUG = args.debug
-    config.base_config.ENABLE_MONITORING = args.enable_monitoring
-    config.base_config.ENABLE_SCHEDULER = args.enable_scheduler
+    updates = {
+        # Interned so lookups against the platform-keyed registries hit by identity
+        "PLATFORM": sys.intern(args.platform),
+        "SAVE_DATA_OPTION": args.save_data_option,
+        "USE_PROXY": args.use_proxy,
+        "PROXY_PROVIDER": args.proxy_provider,
+        "PROXY_API_KEY": args.proxy_api_key,
+        "HEADLESS": args.headless,
+        "USE_CDP": args.use_cdp,
+        "LOGIN_TYPE": args.login_type,
+        "REQUEST_INTERVAL": args.request_interval,
+        "MAX_REQUESTS_PER_MINUTE": args.max_requests_per_minute,
+        "DEBUG": args.debug,
+        "ENABLE_MONITORING": args.enable_monitoring,
+        "ENABLE_SCHEDULER": args.enable_scheduler,
+    }
+    
+    base_config = config.base_config
+    for key, value in updates.items():
+        setattr(base_config, key, value)
 
 
-async def _validate_args(args: argparse.Namespace) -> None:
+def _validate_args(args: argparse.Namespace) -> None:
     """Validate command-line arguments"""
-    # Validate search query
-    if args.crawler_type == "search" and not args.query:
-        raise ValueError("Search query is required for search type crawler")
-    
-    # Validate content ID
-    if args.crawler_type in ["detail", "comments"] and not args.content_id:
-        raise ValueError("Content ID is required for detail and comments type crawlers")
-    
-    # Validate user ID
-    if args.crawler_type in ["creator", "user_content"] and not args.user_id:
-        raise ValueError("User ID is required for creator and user_content type crawlers")
-    
-    # Validate proxy configuration
-    if args.use_proxy and args.proxy_provider == "none":
-        raise ValueError("Proxy provider must be specified when using proxy")
-    
-    # Validate proxy API key
-    if args.use_proxy and args.proxy_provider != "none" and not args.proxy_api_key:
-        raise ValueError("Proxy API key is required for proxy provider")
+    for is_invalid, message in _VALIDATIONS:
+        if is_invalid(args):
+            raise ValueError(message)
+
+
+@lru_cache(maxsize=1)
+def get_args() -> argparse.Namespace:
+    """Parse command-line arguments once and reuse the result"""
+    return parse_cmd()
 
 
 def get_arg_dict(args: argparse.Namespace) -> Dict[str, Any]:
     """Convert arguments to dictionary"""
-    return {
-        "platform": args.platform,
-        "crawler_type": args.crawler_type,
-        "query": args.query,
-        "content_id": args.content_id,
-        "user_id": args.user_id,
-        "max_results": args.max_results,
-        "output": args.output,
-        "init_db": args.init_db,
-        "use_proxy": args.use_proxy,
-        "proxy_provider": args.proxy_provider,
-        "proxy_api_key": args.proxy_api_key,
-        "headless": args.headless,
-        "use_cdp": args.use_cdp,
-        "login_type": args.login_type,
-        "cookies_file": args.cookies_file,
-        "request_interval": args.request_interval,
-        "max_requests_per_minute": args.max_requests_per_minute,
-        "save_data_option": args.save_data_option,
-        "debug": args.debug,
-        "verbose": args.verbose,
-        "enable_monitoring": args.enable_monitoring,
-        "enable_scheduler": args.enable_scheduler
-    }
+    return dict(vars(args))
 
 
 if __name__ == "__main__":
     """Test command-line argument parsing"""
-    import asyncio
-    
-    async def test_parse():
-        args = await parse_cmd()
-        print("Parsed arguments:")
-        print(args)
-        print("\nArgument dictionary:")
-        print(get_arg_dict(args))
-    
-    asyncio.run(test_parse())
\ No newline at end of file
+    args = get_args()
+    print("Parsed arguments:")
+    print(args)
+    print("\nArgument dictionary:")
+    print(get_arg_dict(args))
\ No newline at end of file
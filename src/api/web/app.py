@@ -2,20 +2,30 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from fastapi import FastAPI, HTTPException, Query, Body
+import asyncio
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, Dict, Any, List
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from hashlib import blake2b
+import orjson
+import re
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List, AsyncIterator
 import uvicorn
 
+from src.config import base_config
+from src.core.base.base_crawler import AbstractCrawler
 from src.spiders.factory import CrawlerFactory
-from src.monitoring.monitor import Monitor
+from src.monitoring.monitor import get_monitor, ensure_monitor_started
 from src.storage.factory import StoreFactory
 
 
 app = FastAPI(
     title="SuperCrawler API",
     description="Multi-platform social media crawler API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -23,25 +33,92 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+    max_age=86400,
 )
 
+# Compress larger JSON responses such as crawl result lists
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+class CrawlRequest(BaseModel):
+    """Crawl request body"""
+    platform: str = Field(..., description="Target platform")
+    crawler_type: str = Field(..., description="Crawler type")
+    query: Optional[str] = Field(None, description="Search query")
+    content_id: Optional[str] = Field(None, description="Content ID")
+    user_id: Optional[str] = Field(None, description="User ID")
+    max_results: int = Field(100, description="Maximum number of results")
+    stream: bool = Field(False, description="Stream list results as NDJSON")
+
+
 # Initialize components
-monitor = Monitor()
+monitor = get_monitor()
 store = StoreFactory.create_store("file")
 
+# Static root payload, serialized once at import time
+_ROOT_JSON = orjson.dumps({"message": "SuperCrawler API"})
+
+# Platform catalog, computed once at startup
+_PLATFORMS_CACHE: Dict[str, Dict[str, Any]] = {}
+_PLATFORMS_JSON = b""
+_PLATFORMS_ETAG = ""
+
+# Entity tags in an If-None-Match list; the group is the opaque tag without W/
+_ETAG_PATTERN = re.compile(r'(?:W/)?("[^"]*")')
+
+# Process-wide crawler per platform, cleaned up at shutdown
+_crawlers: Dict[str, AbstractCrawler] = {}
+
+
+def _get_crawler(platform: str) -> AbstractCrawler:
+    """Get the process-wide crawler instance for a platform"""
+    crawler = _crawlers.get(platform)
+    if crawler is None:
+        crawler = CrawlerFactory.create_crawler(platform=platform)
+        # Share the app-wide store and monitor instead of opening one per crawler
+        crawler.store = store
+        crawler.monitor = monitor
+        _crawlers[platform] = crawler
+    return crawler
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check If-None-Match against an ETag using weak comparison (RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    return opaque_tag in _ETAG_PATTERN.findall(if_none_match)
+
+
+async def _iter_ndjson(items: List[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Serialize items one per line, as they are sent"""
+    for item in items:
+        yield orjson.dumps(item) + b"\n"
+
 
 @app.on_event("startup")
 async def startup_event():
     """Startup event"""
-    await monitor.initialize()
+    global _PLATFORMS_JSON, _PLATFORMS_ETAG
+    await ensure_monitor_started()
     await store.initialize()
+    _PLATFORMS_CACHE.update(CrawlerFactory.get_supported_platforms())
+    _PLATFORMS_JSON = orjson.dumps({"platforms": _PLATFORMS_CACHE}, option=orjson.OPT_SORT_KEYS)
+    # Weak, because GZipMiddleware may send a compressed variant under the same tag
+    _PLATFORMS_ETAG = f'W/"{blake2b(_PLATFORMS_JSON, digest_size=8).hexdigest()}"'
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event"""
+    # Close the crawlers' HTTP sessions and browsers; they share the store,
+    # which is closed below
+    await asyncio.gather(*(crawler.cleanup() for crawler in _crawlers.values()))
+    _crawlers.clear()
     await monitor.cleanup()
     await store.close()
 
@@ -49,29 +126,30 @@ async def shutdown_event():
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {"message": "SuperCrawler API"}
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/platforms")
-async def get_platforms():
+async def get_platforms(request: Request):
     """Get supported platforms"""
-    platforms = CrawlerFactory.get_supported_platforms()
-    return {"platforms": platforms}
+    headers = {"ETag": _PLATFORMS_ETAG, "Cache-Control": "public, max-age=300"}
+    if _etag_matches(request.headers.get("if-none-match"), _PLATFORMS_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_PLATFORMS_JSON, media_type="application/json", headers=headers)
 
 
 @app.post("/crawl")
-async def crawl(
-    platform: str = Body(..., description="Target platform"),
-    crawler_type: str = Body(..., description="Crawler type"),
-    query: Optional[str] = Body(None, description="Search query"),
-    content_id: Optional[str] = Body(None, description="Content ID"),
-    user_id: Optional[str] = Body(None, description="User ID"),
-    max_results: int = Body(100, description="Maximum number of results"),
-):
+async def crawl(crawl_request: CrawlRequest):
     """Crawl content"""
+    platform = crawl_request.platform
+    crawler_type = crawl_request.crawler_type
+    query = crawl_request.query
+    content_id = crawl_request.content_id
+    user_id = crawl_request.user_id
+    max_results = crawl_request.max_results
     try:
         # Create crawler
-        crawler = CrawlerFactory.create_crawler(platform=platform)
+        crawler = _get_crawler(platform)
         
         # Execute crawl based on type
         if crawler_type == "search":
@@ -97,14 +175,19 @@ async def crawl(
         else:
             raise HTTPException(status_code=400, detail="Invalid crawler type")
         
+        # Count once and reuse it for the event and the response
+        total = len(results) if isinstance(results, list) else 1
+        
         # Log event
         await monitor.log_event("crawl", {
             "platform": platform,
             "crawler_type": crawler_type,
-            "results_count": len(results) if isinstance(results, list) else 1
+            "results_count": total
         })
         
-        return {"results": results}
+        if crawl_request.stream and isinstance(results, list):
+            return StreamingResponse(_iter_ndjson(results), media_type="application/x-ndjson")
+        return {"results": results, "total": total}
     except Exception as e:
         await monitor.log_error(e, {"platform": platform, "crawler_type": crawler_type})
         raise HTTPException(status_code=500, detail=str(e))
@@ -125,4 +208,12 @@ async def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvicorn picks uvloop and httptools automatically when they are installed
+    uvicorn.run(
+        "src.api.web.app:app",
+        host=base_config.API_HOST,
+        port=base_config.API_PORT,
+        workers=base_config.API_WORKERS,
+        access_log=base_config.DEBUG,
+        log_level="debug" if base_config.DEBUG else "warning"
+    )
\ No newline at end of file
@@ -2,10 +2,30 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-import os
 import platform
+from pathlib import Path
 from typing import Dict, Optional, Any, List
 
+
+def _build_driver_paths() -> Dict[str, str]:
+    """Build driver paths for the current platform"""
+    system = platform.system()
+    if system not in ('Windows', 'Linux', 'Darwin'):
+        return {}
+    
+    drivers_dir = Path(__file__).parent
+    suffix = '.exe' if system == 'Windows' else ''
+    return {
+        'chromium': str(drivers_dir / f'chromedriver{suffix}'),
+        'firefox': str(drivers_dir / f'geckodriver{suffix}'),
+        'webkit': str(drivers_dir / f'webkitdriver{suffix}')
+    }
+
+
+# Driver paths depend only on the host platform, so compute them once
+_DRIVER_PATHS = _build_driver_paths()
+
+
 class DriverManager:
     """Browser driver manager"""
     
@@ -33,25 +53,4 @@ class DriverManager:
     
     def _setup_driver_paths(self):
         """Set up driver paths"""
-        system = platform.system()
-        arch = platform.architecture()[0]
-        
-        # Set up driver paths based on platform
-        if system == 'Windows':
-            self._driver_paths = {
-                'chromium': os.path.join(os.path.dirname(__file__), 'chromedriver.exe'),
-                'firefox': os.path.join(os.path.dirname(__file__), 'geckodriver.exe'),
-                'webkit': os.path.join(os.path.dirname(__file__), 'webkitdriver.exe')
-            }
-        elif system == 'Linux':
-            self._driver_paths = {
-                'chromium': os.path.join(os.path.dirname(__file__), 'chromedriver'),
-                'firefox': os.path.join(os.path.dirname(__file__), 'geckodriver'),
-                'webkit': os.path.join(os.path.dirname(__file__), 'webkitdriver')
-            }
-        elif system == 'Darwin':
-            self._driver_paths = {
-                'chromium': os.path.join(os.path.dirname(__file__), 'chromedriver'),
-                'firefox': os.path.join(os.path.dirname(__file__), 'geckodriver'),
-                'webkit': os.path.join(os.path.dirname(__file__), 'webkitdriver')
-            }
\ No newline at end of file
+        self._driver_paths = dict(_DRIVER_PATHS)
\ No newline at end of file
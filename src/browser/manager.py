@@ -3,7 +3,7 @@
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
 import asyncio
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Set
 
 from playwright.async_api import Playwright, Browser, BrowserContext, Page
 
@@ -13,9 +13,9 @@ class BrowserManager:
     
     def __init__(self):
         self._playwright = None
-        self._browsers = []
-        self._browser_contexts = []
-        self._pages = []
+        self._browsers: Set[Browser] = set()
+        self._browser_contexts: Set[BrowserContext] = set()
+        self._pages: Set[Page] = set()
     
     async def initialize(self):
         """Initialize browser manager"""
@@ -25,7 +25,7 @@ class BrowserManager:
     async def launch_browser(self, **kwargs) -> Browser:
         """Launch a browser"""
         browser = await self._playwright.chromium.launch(**kwargs)
-        self._browsers.append(browser)
+        self._browsers.add(browser)
         return browser
     
     async def create_context(self, browser: Optional[Browser] = None, **kwargs) -> BrowserContext:
@@ -34,7 +34,7 @@ class BrowserManager:
             browser = await self.launch_browser()
         
         context = await browser.new_context(**kwargs)
-        self._browser_contexts.append(context)
+        self._browser_contexts.add(context)
         return context
     
     async def create_page(self, context: Optional[BrowserContext] = None, **kwargs) -> Page:
@@ -43,49 +43,37 @@ class BrowserManager:
             context = await self.create_context()
         
         page = await context.new_page(**kwargs)
-        self._pages.append(page)
+        self._pages.add(page)
         return page
     
     async def close_browser(self, browser: Browser):
         """Close a browser"""
         if browser in self._browsers:
+            # Drop it first so a concurrent close of the same object is a no-op
+            self._browsers.discard(browser)
             await browser.close()
-            self._browsers.remove(browser)
     
     async def close_context(self, context: BrowserContext):
         """Close a browser context"""
         if context in self._browser_contexts:
+            # Drop it first so a concurrent close of the same object is a no-op
+            self._browser_contexts.discard(context)
             await context.close()
-            self._browser_contexts.remove(context)
     
     async def close_page(self, page: Page):
         """Close a page"""
         if page in self._pages:
+            # Drop it first so a concurrent close of the same object is a no-op
+            self._pages.discard(page)
             await page.close()
-            self._pages.remove(page)
     
     async def cleanup(self):
         """Cleanup browser manager"""
-        # Close all pages
-        for page in self._pages:
-            try:
-                await page.close()
-            except Exception:
-                pass
-        
-        # Close all contexts
-        for context in self._browser_contexts:
-            try:
-                await context.close()
-            except Exception:
-                pass
-        
-        # Close all browsers
-        for browser in self._browsers:
-            try:
-                await browser.close()
-            except Exception:
-                pass
+        # Close pages, then contexts, then browsers; each tier is closed concurrently
+        # so one slow or crashed target does not hold up the rest
+        for resources in (self._pages, self._browser_contexts, self._browsers):
+            await asyncio.gather(*(resource.close() for resource in resources), return_exceptions=True)
+            resources.clear()
         
         # Stop playwright
         if self._playwright:
@@ -60,14 +60,18 @@ class BrowserPool:
     
     async def refresh_pool(self):
         """Refresh browser pool"""
-        # Close all contexts and pages
-        for context in self._context_pool:
-            await self._browser_manager.close_context(context)
-        self._context_pool.clear()
-        
-        for page in self._page_pool:
-            await self._browser_manager.close_page(page)
+        # Close all pooled pages and contexts concurrently
+        await asyncio.gather(
+            *(self._browser_manager.close_page(page) for page in self._page_pool),
+            return_exceptions=True
+        )
         self._page_pool.clear()
+        
+        await asyncio.gather(
+            *(self._browser_manager.close_context(context) for context in self._context_pool),
+            return_exceptions=True
+        )
+        self._context_pool.clear()
     
     async def cleanup(self):
         """Cleanup browser pool"""
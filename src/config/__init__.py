@@ -2,27 +2,8 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from .base_config import (
-    BaseConfig,
-    PlatformConfig,
-    XiaohongshuConfig,
-    DouyinConfig,
-    KuaishouConfig,
-    BilibiliConfig,
-    WeiboConfig,
-    TiebaConfig,
-    ZhihuConfig,
-    FacebookConfig,
-    TwitterConfig,
-    InstagramConfig,
-    YoutubeConfig,
-    base_config,
-    platform_configs,
-    get_config,
-    get_platform_config,
-    load_config_from_file,
-    save_config_to_file,
-)
+import importlib
+from typing import Any
 
 __all__ = [
     "BaseConfig",
@@ -40,8 +21,24 @@ __all__ = [
     "YoutubeConfig",
     "base_config",
     "platform_configs",
+    "PLATFORM_CONFIG_CLASSES",
     "get_config",
     "get_platform_config",
     "load_config_from_file",
     "save_config_to_file",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the configuration module on first attribute access"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(".base_config", __name__)
+    # Bind the exported names so later lookups skip this hook; importing the
+    # submodule also bound "base_config" to the module, which this overrides.
+    # platform_configs is left dynamic since building it instantiates every platform.
+    for attr in __all__:
+        if attr != "platform_configs":
+            globals()[attr] = getattr(module, attr)
+    return getattr(module, name)
\ No newline at end of file
@@ -2,13 +2,33 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
+import mmap
 import os
-import json
-from typing import Dict, Optional, Any, List
+import sys
+import orjson
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, Any, List, Type
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
 
+# Request headers shared by the platform configs
+_USER_AGENT = sys.intern(
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+_BASE_HEADERS_CN = MappingProxyType({
+    "User-Agent": _USER_AGENT,
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+})
+_BASE_HEADERS_EN = MappingProxyType({
+    "User-Agent": _USER_AGENT,
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+})
+
+
 class BaseConfig(BaseSettings):
     """Base configuration class"""
     
@@ -17,6 +37,9 @@ class BaseConfig(BaseSettings):
     PROJECT_VERSION: str = "1.0.0"
     DEBUG: bool = False
     
+    # Crawler settings
+    PLATFORM: str = "xhs"  # Platform code, see CrawlerFactory.CRAWLERS
+    
     # Storage settings
     SAVE_DATA_OPTION: str = "json"  # json, csv, excel, sqlite, db, mongodb
     DATA_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -46,6 +69,7 @@ class BaseConfig(BaseSettings):
     # API settings
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    API_WORKERS: int = 1
     API_KEY: Optional[str] = None
     
     # Database settings
@@ -55,10 +79,15 @@ class BaseConfig(BaseSettings):
     DB_USER: str = "root"
     DB_PASSWORD: str = ""
     DB_NAME: str = "supercrawler"
+    DB_POOL_MIN: int = 4
+    DB_POOL_MAX: int = 20
+    DB_CONNECT_TIMEOUT: int = 5  # Seconds
+    INSERT_BATCH_SIZE: int = 1000
     
     # MongoDB settings
     MONGODB_URI: Optional[str] = None
     MONGODB_DB: str = "supercrawler"
+    MONGODB_FAST_WRITE: bool = False  # Unacknowledged (w=0) writes; may lose data on failover
     
     # Redis settings (for caching)
     REDIS_URL: Optional[str] = None
@@ -84,10 +113,12 @@ class BaseConfig(BaseSettings):
     ENABLE_CLOUD_INTEGRATION: bool = False
     CLOUD_PROVIDER: str = "aws"  # aws, gcp, azure
     
-    @validator("DATA_DIR", "COOKIES_DIR", "PLUGINS_DIR", pre=True)
+    @validator("DATA_DIR", "COOKIES_DIR", "PLUGINS_DIR", pre=True, always=True)
     def ensure_dirs_exist(cls, v: str) -> str:
         """Ensure directories exist"""
-        os.makedirs(v, exist_ok=True)
+        # One stat in the common case where the directory is already there
+        if not os.path.isdir(v):
+            os.makedirs(v, exist_ok=True)
         return v
     
     class Config:
@@ -139,12 +170,7 @@ class XiaohongshuConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Content-Type": "application/json",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = {**_BASE_HEADERS_CN, "Content-Type": "application/json"}
     
     COOKIE_KEYS: List[str] = [
         "abRequestId", "xsecappid", "a1", "webId", 
@@ -164,11 +190,7 @@ class DouyinConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_CN)
     
     COOKIE_KEYS: List[str] = [
         "tt_webid", "tt_webid_v2", "odin_tt", 
@@ -188,11 +210,7 @@ class KuaishouConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_CN)
     
     COOKIE_KEYS: List[str] = [
         "clientid", "userId", "kuaishou.server.web_st", 
@@ -212,11 +230,7 @@ class BilibiliConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_CN)
     
     COOKIE_KEYS: List[str] = [
         "SESSDATA", "bili_jct", "DedeUserID", 
@@ -237,11 +251,7 @@ class WeiboConfig(PlatformConfig):
         "store_image", "store_video"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_CN)
     
     COOKIE_KEYS: List[str] = [
         "SUB", "SUBP", "XSRF-TOKEN", 
@@ -262,9 +272,8 @@ class TiebaConfig(PlatformConfig):
     ]
     
     DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        **_BASE_HEADERS_CN,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
     }
     
     COOKIE_KEYS: List[str] = [
@@ -285,11 +294,7 @@ class ZhihuConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_CN)
     
     COOKIE_KEYS: List[str] = [
         "_zap", "d_c0", "z_c0", 
@@ -309,11 +314,7 @@ class FacebookConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_EN)
     
     COOKIE_KEYS: List[str] = [
         "c_user", "xs", "fr", 
@@ -333,11 +334,7 @@ class TwitterConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_EN)
     
     COOKIE_KEYS: List[str] = [
         "auth_token", "ct0", "twid", 
@@ -357,11 +354,7 @@ class InstagramConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_EN)
     
     COOKIE_KEYS: List[str] = [
         "sessionid", "ds_user_id", "csrftoken", 
@@ -381,11 +374,7 @@ class YoutubeConfig(PlatformConfig):
         "user_profile", "user_content", "login"
     ]
     
-    DEFAULT_HEADERS: Dict[str, str] = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
+    DEFAULT_HEADERS: Dict[str, str] = dict(_BASE_HEADERS_EN)
     
     COOKIE_KEYS: List[str] = [
         "SID", "HSID", "SSID", 
@@ -396,48 +385,64 @@ class YoutubeConfig(PlatformConfig):
 # Create configuration instances
 base_config = BaseConfig()
 
-# Platform configurations
-platform_configs = {
-    "xhs": XiaohongshuConfig(),
-    "dy": DouyinConfig(),
-    "ks": KuaishouConfig(),
-    "bili": BilibiliConfig(),
-    "wb": WeiboConfig(),
-    "tieba": TiebaConfig(),
-    "zhihu": ZhihuConfig(),
-    "facebook": FacebookConfig(),
-    "twitter": TwitterConfig(),
-    "instagram": InstagramConfig(),
-    "youtube": YoutubeConfig(),
+# Platform configuration classes, instantiated on first use
+PLATFORM_CONFIG_CLASSES: Dict[str, Type[PlatformConfig]] = {
+    "xhs": XiaohongshuConfig,
+    "dy": DouyinConfig,
+    "ks": KuaishouConfig,
+    "bili": BilibiliConfig,
+    "wb": WeiboConfig,
+    "tieba": TiebaConfig,
+    "zhihu": ZhihuConfig,
+    "facebook": FacebookConfig,
+    "twitter": TwitterConfig,
+    "instagram": InstagramConfig,
+    "youtube": YoutubeConfig,
 }
 
 
+@lru_cache(maxsize=16)
 def get_config(platform: Optional[str] = None) -> Any:
     """Get configuration for a specific platform or base config"""
-    if platform and platform in platform_configs:
-        return platform_configs[platform]
+    if platform in PLATFORM_CONFIG_CLASSES:
+        return get_platform_config(platform)
     return base_config
 
 
+@lru_cache(maxsize=16)
 def get_platform_config(platform: str) -> PlatformConfig:
     """Get platform-specific configuration"""
-    if platform not in platform_configs:
+    # The cache doubles as the instance registry: each platform's config is
+    # built on first request and reused afterwards
+    config_class = PLATFORM_CONFIG_CLASSES.get(platform)
+    if config_class is None:
         raise ValueError(f"Platform {platform} not supported")
-    return platform_configs[platform]
+    return config_class()
+
+
+# Config files at least this large are memory-mapped when loaded
+_MMAP_THRESHOLD = 64 * 1024
 
 
 def load_config_from_file(file_path: str) -> Dict[str, Any]:
     """Load configuration from JSON file"""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        # Parse large files straight from a read-only mapping instead of
+        # copying them into a bytes object; small files are cheaper to read
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+        return orjson.loads(f.read())
 
 
 def save_config_to_file(config_data: Dict[str, Any], file_path: str):
     """Save configuration to JSON file"""
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(config_data, f, indent=2, ensure_ascii=False)
+    with open(file_path, "wb") as f:
+        f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
-# Ensure data directories exist
-os.makedirs(base_config.DATA_DIR, exist_ok=True)
-os.makedirs(base_config.COOKIES_DIR, exist_ok=True)
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Build the full platform_configs mapping only when it is asked for"""
+    if name == "platform_configs":
+        return {platform: get_platform_config(platform) for platform in PLATFORM_CONFIG_CLASSES}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
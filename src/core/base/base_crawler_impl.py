@@ -5,7 +5,9 @@
 import asyncio
 import aiohttp
 import json
-from typing import Dict, Optional, Any, List, AsyncGenerator
+import time
+from types import MappingProxyType
+from typing import Dict, Optional, Any, List, AsyncGenerator, ClassVar, Tuple
 
 from playwright.async_api import BrowserContext, BrowserType, Playwright
 
@@ -13,27 +15,49 @@ from src.core.base.base_crawler import AbstractCrawler
 from src.browser.manager import BrowserManager
 from src.browser.pool.browser_pool import BrowserPool
 from src.storage.factory import StoreFactory
-from src.monitoring.monitor import Monitor
+from src.monitoring.monitor import ensure_monitor_started
 from src.scheduler.scheduler import Scheduler
 from src.proxy.manager import BaseProxyManager
 
+# Default request headers, built once for every crawler
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
 
 class BaseCrawler(AbstractCrawler):
     """Base crawler implementation"""
     
+    # Shared by all instances; subclasses override at class level
+    platform_name: ClassVar[str] = "Base"
+    supported_features: ClassVar[Tuple[str, ...]] = (
+        "search",
+        "content_detail",
+        "comments",
+        "user_profile",
+        "user_content",
+        "login"
+    )
+    # store_data type -> store method name
+    _STORE_METHODS: ClassVar[Dict[str, str]] = {
+        'content': 'store_content',
+        'comment': 'store_comment',
+        'creator': 'store_creator'
+    }
+    
     def __init__(self):
-        self.platform_name = "Base"
-        self.supported_features = []
         self.browser_manager = BrowserManager()
         self.browser_pool = BrowserPool()
         self.store = None
         self.monitor = None
+        self._owns_store = False
         self.scheduler = None
         self.proxy_manager = None
         self.api_client = None
         self.playwright = None
         self.browser_context = None
         self.config = None
+        self._session: Optional[aiohttp.ClientSession] = None
     
     async def start(self):
         """Start crawler"""
@@ -52,13 +76,15 @@ class BaseCrawler(AbstractCrawler):
         await self.browser_manager.initialize()
         await self.browser_pool.initialize()
         
-        # Initialize store
-        self.store = StoreFactory.create_store("file")
-        await self.store.initialize()
+        # Initialize store, unless a shared one was injected
+        if self.store is None:
+            self.store = StoreFactory.create_store("file")
+            await self.store.initialize()
+            self._owns_store = True
         
-        # Initialize monitor
-        self.monitor = Monitor()
-        await self.monitor.initialize()
+        # Use the process-wide monitor, unless another one was injected
+        if self.monitor is None:
+            self.monitor = await ensure_monitor_started()
         
         # Initialize scheduler
         self.scheduler = Scheduler()
@@ -73,9 +99,7 @@ class BaseCrawler(AbstractCrawler):
         # Load configuration from file or environment
         self.config = {
             'timeout': 30,
-            'headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            'headers': DEFAULT_HEADERS
         }
     
     async def crawl(self):
@@ -122,53 +146,78 @@ class BaseCrawler(AbstractCrawler):
         """Get platform name"""
         return self.platform_name
     
-    def get_supported_features(self) -> List[str]:
-        """Get list of supported features"""
+    def get_supported_features(self) -> Tuple[str, ...]:
+        """Get supported features"""
         return self.supported_features
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the crawler's HTTP session, creating it on first use"""
+        # One keep-alive connection pool for all API requests; the default
+        # headers are set once on the session rather than passed per request
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.config.get('headers', {}))
+        return self._session
+    
     async def api_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
         """Make API request"""
         # Get proxy
         proxy = await self.proxy_manager.get_proxy()
         
         # Make request
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.request(
-                    method, 
-                    url, 
-                    headers=self.config.get('headers', {}),
-                    proxy=proxy.get('http') if proxy else None,
-                    **kwargs
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        await self.monitor.log_event('success', {'url': url})
-                        return data
-                    else:
-                        await self.monitor.log_event('failure', {'url': url, 'status': response.status})
-            except Exception as e:
-                await self.monitor.log_error(e, {'url': url})
+        session = self._get_session()
+        try:
+            started = time.perf_counter()
+            async with session.request(
+                method, 
+                url, 
+                proxy=proxy.get('http') if proxy else None,
+                **kwargs
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    response_time = time.perf_counter() - started
+                    await self.monitor.log_event('success', {'url': url, 'response_time': response_time})
+                    return data
+                else:
+                    await self.monitor.log_event('failure', {'url': url, 'status': response.status})
+        except aiohttp.ClientProxyConnectionError as e:
+            # Stop handing out a proxy we couldn't connect through
+            self.proxy_manager.report_bad(proxy)
+            await self.monitor.log_error(e, {'url': url})
+        except Exception as e:
+            await self.monitor.log_error(e, {'url': url})
         
         return {}
     
     async def store_data(self, data: Dict[str, Any], data_type: str):
         """Store data"""
-        if data_type == 'content':
-            await self.store.store_content(data)
-        elif data_type == 'comment':
-            await self.store.store_comment(data)
-        elif data_type == 'creator':
-            await self.store.store_creator(data)
+        method_name = self._STORE_METHODS.get(data_type)
+        if method_name is None:
+            supported = ", ".join(self._STORE_METHODS)
+            raise ValueError(f"Invalid data type: {data_type!r}. Supported: {supported}")
+        await getattr(self.store, method_name)(data)
+    
+    async def store_contents(self, content_items: List[Dict[str, Any]]):
+        """Store a batch of content items"""
+        if content_items:
+            await self.store.store_contents(content_items)
     
     async def cleanup(self):
         """Cleanup crawler"""
         # Cleanup components
         await self.browser_pool.cleanup()
         await self.browser_manager.cleanup()
-        await self.store.close()
-        await self.monitor.cleanup()
-        await self.scheduler.cleanup()
+        if self._owns_store:
+            await self.store.close()
+        # Created by initialize_components, so unset on a crawler never started.
+        # The monitor is shared, so it is left to its owner to clean up
+        if self.scheduler is not None:
+            await self.scheduler.cleanup()
+        if self.proxy_manager is not None:
+            await self.proxy_manager.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     async def handle_captcha(self, page):
         """Handle captcha"""
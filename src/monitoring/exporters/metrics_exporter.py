@@ -2,9 +2,13 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-import json
 from typing import Dict, Optional, Any, List
 
+import orjson
+
+# orjson writes UTF-8 directly; non-string keys are allowed in metric maps
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 class MetricsExporter:
     """Metrics exporter for monitoring system"""
     
@@ -42,8 +46,8 @@ class FileExporter(BaseExporter):
     async def export(self, metrics: Dict[str, Any]):
         """Export metrics to file"""
         try:
-            with open(self._file_path, 'w', encoding='utf-8') as f:
-                json.dump(metrics, f, ensure_ascii=False, indent=2)
+            with open(self._file_path, 'wb') as f:
+                f.write(orjson.dumps(metrics, option=_DUMP_OPTIONS))
         except Exception:
             pass
 
@@ -54,6 +58,6 @@ class ConsoleExporter(BaseExporter):
     async def export(self, metrics: Dict[str, Any]):
         """Export metrics to console"""
         try:
-            print(json.dumps(metrics, ensure_ascii=False, indent=2))
+            print(orjson.dumps(metrics, option=_DUMP_OPTIONS).decode())
         except Exception:
             pass
\ No newline at end of file
@@ -5,30 +5,71 @@
 import asyncio
 import psutil
 import time
-from typing import Dict, Optional, Any, List
+from collections import deque
+from functools import cache
+from itertools import islice
+from typing import Dict, Optional, Any, List, NamedTuple, Tuple
 
 from src.core.base.base_crawler import AbstractMonitor
 
+# statvfs is comparatively slow and disk usage changes slowly
+DISK_USAGE_TTL = 60.0
+# Number of recent events and errors kept in memory
+HISTORY_SIZE = 1000
+
+
+class MonitorSnapshot(NamedTuple):
+    """Immutable point-in-time view of the monitor counters"""
+    uptime: float
+    requests: int
+    successes: int
+    failures: int
+    success_rate: float
+    avg_response_time: float
+
 
 class Monitor(AbstractMonitor):
     """Monitor implementation"""
     
+    # Counters are updated on every request; plain slot attributes avoid the
+    # nested dict lookups, and get_stats builds the report dict on demand
+    __slots__ = (
+        '_events',
+        '_errors',
+        '_start_ns',
+        '_requests',
+        '_successes',
+        '_failures',
+        '_avg_response_time',
+        '_timed_responses',
+        '_process',
+        '_system_stats',
+        '_disk_usage',
+        '_disk_checked_at'
+    )
+    
     def __init__(self):
-        self._events = []
-        self._errors = []
-        self._stats = {
-            'start_time': time.time(),
-            'requests': 0,
-            'successes': 0,
-            'failures': 0,
-            'avg_response_time': 0,
-            'total_response_time': 0
-        }
+        # Ring buffers; the oldest entries drop off once full
+        self._events = deque(maxlen=HISTORY_SIZE)
+        self._errors = deque(maxlen=HISTORY_SIZE)
+        # Monotonic, so uptime can't jump with wall-clock adjustments
+        self._start_ns = time.monotonic_ns()
+        self._requests = 0
+        self._successes = 0
+        self._failures = 0
+        self._avg_response_time = 0.0
+        self._timed_responses = 0
+        # Handle on this process for the per-process CPU and RSS figures
+        self._process = psutil.Process()
         self._system_stats = {}
+        self._disk_usage = 0.0
+        self._disk_checked_at = None
     
     async def initialize(self):
         """Initialize monitor"""
-        pass
+        # Prime the CPU counters; non-blocking calls measure from the previous one
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
     
     async def log_event(self, event_type: str, data: Dict[str, Any]):
         """Log event"""
@@ -41,11 +82,16 @@ class Monitor(AbstractMonitor):
         
         # Update stats based on event type
         if event_type == 'request':
-            self._stats['requests'] += 1
+            self._requests += 1
         elif event_type == 'success':
-            self._stats['successes'] += 1
+            self._successes += 1
+            response_time = data.get('response_time')
+            if response_time is not None:
+                # Incremental mean; no running sum to grow or lose precision
+                self._timed_responses += 1
+                self._avg_response_time += (response_time - self._avg_response_time) / self._timed_responses
         elif event_type == 'failure':
-            self._stats['failures'] += 1
+            self._failures += 1
     
     async def log_error(self, error: Exception, context: Dict[str, Any]):
         """Log error"""
@@ -55,35 +101,35 @@ class Monitor(AbstractMonitor):
             'context': context
         }
         self._errors.append(error_log)
-        self._stats['failures'] += 1
+        self._failures += 1
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get statistics"""
         # Update system stats
         await self._update_system_stats()
         
-        # Calculate uptime
-        uptime = time.time() - self._stats['start_time']
+        stats = self.snapshot()._asdict()
+        stats['system'] = self._system_stats
+        return stats
+    
+    def snapshot(self) -> MonitorSnapshot:
+        """Get the current counters without sampling system stats"""
+        # Calculate uptime; integer nanoseconds until reported in seconds
+        uptime = (time.monotonic_ns() - self._start_ns) / 1e9
         
         # Calculate success rate
         success_rate = 0
-        if self._stats['requests'] > 0:
-            success_rate = (self._stats['successes'] / self._stats['requests']) * 100
+        if self._requests > 0:
+            success_rate = (self._successes / self._requests) * 100
         
-        # Calculate average response time
-        avg_response_time = 0
-        if self._stats['successes'] > 0:
-            avg_response_time = self._stats['total_response_time'] / self._stats['successes']
-        
-        return {
-            'uptime': uptime,
-            'requests': self._stats['requests'],
-            'successes': self._stats['successes'],
-            'failures': self._stats['failures'],
-            'success_rate': success_rate,
-            'avg_response_time': avg_response_time,
-            'system': self._system_stats
-        }
+        return MonitorSnapshot(
+            uptime,
+            self._requests,
+            self._successes,
+            self._failures,
+            success_rate,
+            self._avg_response_time
+        )
     
     async def check_health(self) -> Dict[str, Any]:
         """Check health status"""
@@ -107,32 +153,67 @@ class Monitor(AbstractMonitor):
     
     async def _update_system_stats(self):
         """Update system statistics"""
-        # Get CPU usage
-        cpu_usage = psutil.cpu_percent(interval=0.1)
-        
-        # Get memory usage
-        memory = psutil.virtual_memory()
-        memory_usage = memory.percent
-        
-        # Get disk usage
-        disk = psutil.disk_usage('/')
-        disk_usage = disk.percent
-        
-        # Get network stats
-        network = psutil.net_io_counters()
+        # psutil reads /proc and calls statvfs; keep those syscalls off the event loop
+        (cpu_usage, process_cpu_usage, memory_usage, memory_rss,
+         disk_usage, network) = await asyncio.to_thread(self._sample_system)
         
         self._system_stats = {
             'cpu_usage': cpu_usage,
+            'process_cpu_usage': process_cpu_usage,
             'memory_usage': memory_usage,
+            'memory_rss': memory_rss,
             'disk_usage': disk_usage,
             'network_sent': network.bytes_sent,
             'network_recv': network.bytes_recv
         }
     
+    def _sample_system(self) -> Tuple[float, float, float, int, float, Any]:
+        """Sample system counters; runs in a worker thread"""
+        # Get CPU usage since the previous sample, system-wide and for this
+        # process, without sleeping
+        cpu_usage = psutil.cpu_percent(interval=None)
+        process_cpu_usage = self._process.cpu_percent(interval=None)
+        
+        # Get memory usage, system-wide and for this process
+        memory_usage = psutil.virtual_memory().percent
+        memory_rss = self._process.memory_info().rss
+        
+        # Get disk usage, refreshed at most every DISK_USAGE_TTL seconds
+        now = time.monotonic()
+        if self._disk_checked_at is None or now - self._disk_checked_at >= DISK_USAGE_TTL:
+            self._disk_usage = psutil.disk_usage('/').percent
+            self._disk_checked_at = now
+        
+        # Get network stats
+        network = psutil.net_io_counters()
+        
+        return cpu_usage, process_cpu_usage, memory_usage, memory_rss, self._disk_usage, network
+    
     async def get_events(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent events"""
-        return self._events[-limit:]
+        return list(islice(self._events, max(len(self._events) - limit, 0), None))
     
     async def get_errors(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent errors"""
-        return self._errors[-limit:]
\ No newline at end of file
+        return list(islice(self._errors, max(len(self._errors) - limit, 0), None))
+
+
+# Initialization of the process-wide monitor, with the loop it runs on; a
+# future from an earlier asyncio.run can't be awaited on a new loop
+_started: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = None
+
+
+@cache
+def get_monitor() -> Monitor:
+    """Get the process-wide monitor, created on first call"""
+    return Monitor()
+
+
+async def ensure_monitor_started() -> Monitor:
+    """Initialize the process-wide monitor once and return it"""
+    global _started
+    loop = asyncio.get_running_loop()
+    if _started is None or _started[0] is not loop:
+        _started = (loop, loop.create_task(get_monitor().initialize()))
+    await asyncio.shield(_started[1])
+    return get_monitor()
\ No newline at end of file
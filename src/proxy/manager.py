@@ -4,44 +4,150 @@
 
 import asyncio
 import aiohttp
+import time
+from collections import deque
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, Any, List
 
 from src.core.base.base_crawler import AbstractProxyManager
 
+# Seconds a successful validation is trusted before the proxy is re-checked
+VALIDATION_TTL = 30.0
+# Outbound HTTP requests a manager runs at once, to stay under provider rate limits
+MAX_CONCURRENT_REQUESTS = 8
+# Below this many proxies, a reload starts in the background
+LOW_WATER_MARK = 3
+# Minimum seconds between background refills, so a provider that returns
+# few proxies isn't asked again on every request
+REFILL_INTERVAL = 60.0
+# Seconds a proxy reported bad is kept out of reloads
+BAD_PROXY_TTL = 300.0
+
 
 class BaseProxyManager(AbstractProxyManager):
     """Base proxy manager implementation"""
     
     def __init__(self):
-        self._proxies = []
-        self._current_proxy_index = 0
+        # The current proxy is always at the front; rotating moves it to the back
+        self._proxies = deque()
         self._proxy_stats = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Proxy URL -> monotonic time of its last successful validation
+        self._validated_at: Dict[str, float] = {}
+        # Proxy URL -> monotonic time it was reported bad
+        self._reported_at: Dict[str, float] = {}
+        # In-flight validations and load, shared by concurrent callers
+        self._validations: Dict[str, asyncio.Future] = {}
+        self._loading: Optional[asyncio.Future] = None
+        # Monotonic time the last reload started
+        self._loaded_at: Optional[float] = None
     
     async def initialize(self):
         """Initialize proxy manager"""
         pass
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        # One keep-alive connection pool for provider fetches and validation,
+        # instead of a new session (and TCP/TLS setup) per call
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=10)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
     async def get_proxy(self) -> Optional[Dict[str, str]]:
         """Get a proxy"""
         if not self._proxies:
-            await self._load_proxies()
+            await self._ensure_loaded()
         
         if not self._proxies:
             return None
         
         # Get current proxy
-        proxy = self._proxies[self._current_proxy_index]
+        proxy = self._proxies[0]
         
         # Validate proxy
-        if not await self.validate_proxy(proxy):
-            # Remove invalid proxy
-            self._proxies.pop(self._current_proxy_index)
-            self._current_proxy_index = 0
+        if not await self.check_proxy(proxy):
+            # Remove invalid proxy and keep it out of the reload below
+            self.report_bad(proxy)
             return await self.get_proxy()
         
+        # Top up before running dry, while the remaining proxies stay in use
+        if len(self._proxies) < LOW_WATER_MARK and (
+            self._loaded_at is None or time.monotonic() - self._loaded_at >= REFILL_INTERVAL
+        ):
+            self._start_loading()
+        
         return proxy
     
+    def report_bad(self, proxy: Dict[str, str]):
+        """Drop a proxy that just failed and keep it out of reloads for a while"""
+        proxy_url = proxy.get('http') or proxy.get('https')
+        self._validated_at.pop(proxy_url, None)
+        self._reported_at[proxy_url] = time.monotonic()
+        if proxy in self._proxies:
+            self._proxies.remove(proxy)
+    
+    def _start_loading(self) -> asyncio.Future:
+        """Start a reload unless one is already running"""
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(self._reload())
+            self._loading.add_done_callback(lambda _: setattr(self, '_loading', None))
+        return self._loading
+    
+    async def _ensure_loaded(self):
+        """Load proxies once, however many callers find the list empty"""
+        await asyncio.shield(self._start_loading())
+    
+    async def _reload(self):
+        """Load proxies, dropping repeats and recently reported bad ones"""
+        self._loaded_at = time.monotonic()
+        await self._load_proxies()
+        
+        # Providers append what they fetch to the live list
+        now = time.monotonic()
+        self._reported_at = {
+            proxy_url: reported_at for proxy_url, reported_at in self._reported_at.items()
+            if now - reported_at < BAD_PROXY_TTL
+        }
+        seen = set(self._reported_at)
+        proxies = deque()
+        for proxy in self._proxies:
+            proxy_url = proxy.get('http') or proxy.get('https')
+            if proxy_url not in seen:
+                seen.add(proxy_url)
+                proxies.append(proxy)
+        self._proxies = proxies
+    
+    async def check_proxy(self, proxy: Dict[str, str]) -> bool:
+        """Validate a proxy, reusing recent results and in-flight checks"""
+        proxy_url = proxy.get('http') or proxy.get('https')
+        validated_at = self._validated_at.get(proxy_url)
+        if validated_at is not None and time.monotonic() - validated_at < VALIDATION_TTL:
+            return True
+        
+        # Single flight: concurrent callers for the same proxy share one request
+        future = self._validations.get(proxy_url)
+        if future is None:
+            future = asyncio.ensure_future(self.validate_proxy(proxy))
+            self._validations[proxy_url] = future
+            future.add_done_callback(lambda _: self._validations.pop(proxy_url, None))
+        
+        is_valid = await asyncio.shield(future)
+        if is_valid:
+            self._validated_at[proxy_url] = time.monotonic()
+        else:
+            self._validated_at.pop(proxy_url, None)
+        return is_valid
+    
     async def validate_proxy(self, proxy: Dict[str, str]) -> bool:
         """Validate a proxy"""
         proxy_url = proxy.get('http') or proxy.get('https')
@@ -49,8 +155,10 @@ class BaseProxyManager(AbstractProxyManager):
             return False
         
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-                async with session.get('https://www.baidu.com', proxy=proxy_url) as response:
+            session = await self._get_session()
+            async with self._request_semaphore:
+                async with session.get('https://www.baidu.com', proxy=proxy_url,
+                                       timeout=aiohttp.ClientTimeout(total=5)) as response:
                     if response.status == 200:
                         return True
         except Exception:
@@ -60,8 +168,7 @@ class BaseProxyManager(AbstractProxyManager):
     
     async def rotate_proxy(self):
         """Rotate to next proxy"""
-        if self._proxies:
-            self._current_proxy_index = (self._current_proxy_index + 1) % len(self._proxies)
+        self._proxies.rotate(-1)
     
     async def get_proxy_stats(self) -> Dict[str, Any]:
         """Get proxy statistics"""
@@ -3,18 +3,23 @@
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
 import asyncio
+from collections import deque
 from typing import Dict, Optional, Any, List
 
 from src.proxy.manager import BaseProxyManager
 
+# Number of proxies requested from the manager per refresh
+REFILL_SIZE = 10
+
 
 class ProxyPool:
     """Proxy pool implementation"""
     
     def __init__(self, proxy_manager: BaseProxyManager):
         self._proxy_manager = proxy_manager
-        self._available_proxies = []
-        self._validating = False
+        self._available_proxies = deque()
+        # Callers that find the pool empty wait for one shared refresh
+        self._refresh_lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize proxy pool"""
@@ -24,16 +29,17 @@ class ProxyPool:
     async def get_proxy(self) -> Optional[Dict[str, str]]:
         """Get a proxy from pool"""
         if not self._available_proxies:
-            await self._refresh_pool()
+            await self._refresh_pool(force=False)
         
         if not self._available_proxies:
             return None
         
         # Get first available proxy
-        proxy = self._available_proxies.pop(0)
+        proxy = self._available_proxies.popleft()
         
-        # Validate proxy
-        if not await self._proxy_manager.validate_proxy(proxy):
+        # Validate proxy, reusing the manager's recent results
+        if not await self._proxy_manager.check_proxy(proxy):
+            self._proxy_manager.report_bad(proxy)
             return await self.get_proxy()
         
         return proxy
@@ -47,34 +53,23 @@ class ProxyPool:
         """Refresh proxy pool"""
         await self._refresh_pool()
     
-    async def _refresh_pool(self):
+    async def _refresh_pool(self, force: bool = True):
         """Refresh proxy pool internal implementation"""
-        if self._validating:
-            return
-        
-        self._validating = True
-        
-        try:
-            # Get all proxies from manager
+        async with self._refresh_lock:
+            # Another caller may have refilled the pool while we waited
+            if not force and self._available_proxies:
+                return
+            
+            # Get a batch of proxies from manager; get_proxy only returns
+            # proxies that passed validation, so they are not re-checked here
             proxies = []
-            for _ in range(10):  # Try to get 10 proxies
+            for _ in range(REFILL_SIZE):
                 proxy = await self._proxy_manager.get_proxy()
                 if proxy and proxy not in proxies:
                     proxies.append(proxy)
                 await self._proxy_manager.rotate_proxy()
             
-            # Validate all proxies
-            valid_proxies = []
-            tasks = [self._proxy_manager.validate_proxy(proxy) for proxy in proxies]
-            results = await asyncio.gather(*tasks)
-            
-            for proxy, is_valid in zip(proxies, results):
-                if is_valid:
-                    valid_proxies.append(proxy)
-            
-            self._available_proxies = valid_proxies
-        finally:
-            self._validating = False
+            self._available_proxies = deque(proxies)
     
     async def get_pool_size(self) -> int:
         """Get pool size"""
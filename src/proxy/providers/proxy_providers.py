@@ -3,11 +3,25 @@
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
 import asyncio
-import aiohttp
+import logging
+import orjson
+import re
 from typing import Dict, Optional, Any, List
 
 from src.proxy.manager import BaseProxyManager
 
+logger = logging.getLogger(__name__)
+
+# ip:port pairs in scraped pages, matched on the raw bytes
+_PROXY_PATTERN = re.compile(rb'\d+\.\d+\.\d+\.\d+:\d+')
+
+
+def _make_proxy(address: str) -> Dict[str, str]:
+    """Build a proxy mapping for an ip:port address"""
+    # Both schemes go through the same HTTP proxy; build the URL once
+    proxy_url = f'http://{address}'
+    return {'http': proxy_url, 'https': proxy_url}
+
 
 class FileProxyProvider(BaseProxyManager):
     """File proxy provider"""
@@ -19,19 +33,17 @@ class FileProxyProvider(BaseProxyManager):
     async def _load_proxies(self):
         """Load proxies from file"""
         try:
-            with open(self._proxy_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            with open(self._proxy_file, 'rb') as f:
+                lines = f.read().splitlines()
             
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    proxy = {
-                        'http': f'http://{line}',
-                        'https': f'http://{line}'
-                    }
-                    self._proxies.append(proxy)
+            # Decode only the lines that are kept
+            self._proxies.extend(
+                _make_proxy(line.decode('utf-8'))
+                for line in (raw_line.strip() for raw_line in lines)
+                if line and not line.startswith(b'#')
+            )
         except Exception as e:
-            print(f"Error loading proxies from file: {e}")
+            logger.error("Error loading proxies from file: %s", e)
 
 
 class ApiProxyProvider(BaseProxyManager):
@@ -49,22 +61,23 @@ class ApiProxyProvider(BaseProxyManager):
             if self._api_key:
                 headers['Authorization'] = f'Bearer {self._api_key}'
             
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            async with self._request_semaphore:
                 async with session.get(self._api_url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        proxies = data.get('proxies', [])
-                        
-                        for proxy in proxies:
-                            proxy_url = proxy.get('url') or f"{proxy.get('ip')}:{proxy.get('port')}"
-                            if proxy_url:
-                                proxy_dict = {
-                                    'http': f'http://{proxy_url}',
-                                    'https': f'http://{proxy_url}'
-                                }
-                                self._proxies.append(proxy_dict)
+                    body = await response.read() if response.status == 200 else None
+            
+            if body is not None:
+                # Parse the body bytes directly; aiohttp's json() decodes to
+                # str and goes through the stdlib parser
+                data = orjson.loads(body)
+                proxies = data.get('proxies', [])
+                
+                for proxy in proxies:
+                    proxy_url = proxy.get('url') or f"{proxy.get('ip')}:{proxy.get('port')}"
+                    if proxy_url:
+                        self._proxies.append(_make_proxy(proxy_url))
         except Exception as e:
-            print(f"Error loading proxies from API: {e}")
+            logger.error("Error loading proxies from API: %s", e)
 
 
 class FreeProxyProvider(BaseProxyManager):
@@ -81,26 +94,27 @@ class FreeProxyProvider(BaseProxyManager):
     async def _load_proxies(self):
         """Load proxies from free sources"""
         try:
-            async with aiohttp.ClientSession() as session:
-                for url in self._free_proxy_urls:
-                    try:
+            session = await self._get_session()
+            # Known proxy URLs, for O(1) de-duplication across sources
+            known = {proxy['http'] for proxy in self._proxies}
+            for url in self._free_proxy_urls:
+                try:
+                    async with self._request_semaphore:
                         async with session.get(url) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                # Simple parsing to extract proxies
-                                # Note: This is a basic implementation and may need to be adjusted
-                                # based on the actual HTML structure of the proxy sites
-                                import re
-                                proxies = re.findall(r'\d+\.\d+\.\d+\.\d+:\d+', html)
-                                
-                                for proxy in proxies:
-                                    proxy_dict = {
-                                        'http': f'http://{proxy}',
-                                        'https': f'http://{proxy}'
-                                    }
-                                    if proxy_dict not in self._proxies:
-                                        self._proxies.append(proxy_dict)
-                    except Exception as e:
-                        print(f"Error fetching proxies from {url}: {e}")
+                            html = await response.read() if response.status == 200 else None
+                    
+                    if html is not None:
+                        # Simple parsing to extract proxies
+                        # Note: This is a basic implementation and may need to be adjusted
+                        # based on the actual HTML structure of the proxy sites
+                        proxies = _PROXY_PATTERN.findall(html)
+                        
+                        for match in proxies:
+                            proxy_dict = _make_proxy(match.decode('ascii'))
+                            if proxy_dict['http'] not in known:
+                                known.add(proxy_dict['http'])
+                                self._proxies.append(proxy_dict)
+                except Exception as e:
+                    logger.warning("Error fetching proxies from %s: %s", url, e)
         except Exception as e:
-            print(f"Error loading free proxies: {e}")
\ No newline at end of file
+            logger.error("Error loading free proxies: %s", e)
\ No newline at end of file
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
+import asyncio
 import random
 from typing import Dict, Optional, Any, List
 
@@ -46,7 +47,7 @@ class RandomProxyStrategy:
         proxy = random.choice(self._proxy_list)
         
         # Validate proxy
-        if not await self._proxy_manager.validate_proxy(proxy):
+        if not await self._proxy_manager.check_proxy(proxy):
             self._proxy_list.remove(proxy)
             return await self.get_proxy()
         
@@ -71,11 +72,12 @@ class PriorityProxyStrategy:
                     proxies.append(proxy)
                 await self._proxy_manager.rotate_proxy()
             
-            # Validate and sort proxies by speed
-            valid_proxies = []
-            for proxy in proxies:
-                if await self._proxy_manager.validate_proxy(proxy):
-                    valid_proxies.append(proxy)
+            # Validate all candidates concurrently, keeping the load order
+            results = await asyncio.gather(
+                *(self._proxy_manager.check_proxy(proxy) for proxy in proxies),
+                return_exceptions=True
+            )
+            valid_proxies = [proxy for proxy, ok in zip(proxies, results) if ok is True]
             
             # Sort by speed (simplified - just return in any order)
             self._priority_proxies = valid_proxies
@@ -87,7 +89,7 @@ class PriorityProxyStrategy:
         proxy = self._priority_proxies[0]
         
         # Validate proxy
-        if not await self._proxy_manager.validate_proxy(proxy):
+        if not await self._proxy_manager.check_proxy(proxy):
             self._priority_proxies.pop(0)
             return await self.get_proxy()
         
@@ -3,8 +3,10 @@
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
 import asyncio
+import heapq
+import itertools
 import time
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 
 from src.core.base.base_crawler import AbstractScheduler
 
@@ -13,16 +15,25 @@ class Scheduler(AbstractScheduler):
     """Scheduler implementation"""
     
     def __init__(self):
-        self._tasks = []
-        self._recurring_tasks = []
+        # Task ID -> task, for lookups by cancel_task and get_pending_tasks
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._recurring_tasks: Dict[str, Dict[str, Any]] = {}
+        # Min-heap of (monotonic due time, sequence, task); the loop only looks
+        # at the root, and cancelled entries are dropped when they surface.
+        # Wall-clock times in the task dicts are informational only
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
         self._task_counter = 0
         self._running = False
+        self._process_task: Optional[asyncio.Task] = None
     
     async def initialize(self):
         """Initialize scheduler"""
         self._running = True
-        # Start task processing loop
-        asyncio.create_task(self._process_tasks())
+        # Start task processing loop; keep a reference so it can't be
+        # garbage collected mid-run and can be cancelled on cleanup
+        self._process_task = asyncio.create_task(self._process_tasks())
     
     async def schedule_task(self, task: Dict[str, Any], delay: int = 0):
         """Schedule a task"""
@@ -36,7 +47,8 @@ class Scheduler(AbstractScheduler):
             'status': 'scheduled'
         }
         
-        self._tasks.append(scheduled_task)
+        self._tasks[task_id] = scheduled_task
+        self._push(time.monotonic() + delay, scheduled_task)
         return task_id
     
     async def schedule_recurring_task(self, task: Dict[str, Any], interval: int):
@@ -52,36 +64,31 @@ class Scheduler(AbstractScheduler):
             'status': 'active'
         }
         
-        self._recurring_tasks.append(recurring_task)
+        self._recurring_tasks[task_id] = recurring_task
+        # Never run yet, so due straight away
+        self._push(time.monotonic(), recurring_task)
         return task_id
     
     async def cancel_task(self, task_id: str):
         """Cancel a task"""
-        # Cancel scheduled task
-        for i, task in enumerate(self._tasks):
-            if task['id'] == task_id:
-                self._tasks[i]['status'] = 'cancelled'
-                return True
+        task = self._tasks.get(task_id) or self._recurring_tasks.get(task_id)
+        if task is None:
+            return False
         
-        # Cancel recurring task
-        for i, task in enumerate(self._recurring_tasks):
-            if task['id'] == task_id:
-                self._recurring_tasks[i]['status'] = 'cancelled'
-                return True
-        
-        return False
+        task['status'] = 'cancelled'
+        return True
     
     async def get_pending_tasks(self) -> List[Dict[str, Any]]:
         """Get pending tasks"""
         pending_tasks = []
         
         # Get scheduled tasks
-        for task in self._tasks:
+        for task in self._tasks.values():
             if task['status'] == 'scheduled':
                 pending_tasks.append(task)
         
         # Get recurring tasks
-        for task in self._recurring_tasks:
+        for task in self._recurring_tasks.values():
             if task['status'] == 'active':
                 pending_tasks.append(task)
         
@@ -90,33 +97,54 @@ class Scheduler(AbstractScheduler):
     async def cleanup(self):
         """Cleanup scheduler"""
         self._running = False
+        task = self._process_task
+        self._process_task = None
+        if task:
+            # Cancel rather than wait out the loop's sleep
+            task.cancel()
+            try:
+                await asyncio.wait_for(task, 5.0)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+    
+    def _push(self, due_at: float, task: Dict[str, Any]):
+        """Queue a task to run at due_at and wake the loop if it is now first"""
+        # The sequence number breaks ties so task dicts are never compared
+        heapq.heappush(self._heap, (due_at, next(self._sequence), task))
+        if self._heap[0][2] is task:
+            self._wakeup.set()
     
     async def _process_tasks(self):
         """Process tasks loop"""
+        heap = self._heap
         while self._running:
-            current_time = time.time()
-            
-            # Process scheduled tasks
-            completed_tasks = []
-            for i, task in enumerate(self._tasks):
-                if task['status'] == 'scheduled' and current_time >= task['scheduled_at']:
-                    # Execute task
-                    await self._execute_task(task)
-                    completed_tasks.append(i)
-            
-            # Remove completed tasks
-            for i in reversed(completed_tasks):
-                self._tasks.pop(i)
+            # One clock read per tick; monotonic, so a wall-clock jump can't
+            # fire tasks early or stall them
+            current_time = time.monotonic()
             
-            # Process recurring tasks
-            for task in self._recurring_tasks:
-                if task['status'] == 'active' and current_time - task['last_run'] >= task['interval']:
-                    # Execute task
+            # Run due tasks; everything after the root is due later
+            while heap and heap[0][0] <= current_time:
+                _, _, task = heapq.heappop(heap)
+                
+                if 'interval' in task:
+                    if task['status'] != 'active':
+                        continue
                     await self._execute_task(task)
-                    task['last_run'] = current_time
+                    task['last_run'] = time.time()
+                    if task['status'] == 'active':
+                        self._push(current_time + task['interval'], task)
+                else:
+                    if task['status'] == 'scheduled':
+                        await self._execute_task(task)
+                    self._tasks.pop(task['id'], None)
             
-            # Sleep for a short time
-            await asyncio.sleep(1)
+            # Sleep until the next task is due or a sooner one is scheduled
+            self._wakeup.clear()
+            timeout = max(heap[0][0] - time.monotonic(), 0) if heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
     
     async def _execute_task(self, task: Dict[str, Any]):
         """Execute a task"""
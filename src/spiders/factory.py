@@ -2,30 +2,58 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from typing import Dict, Type, Optional, Any
+from collections.abc import Mapping
+from typing import Dict, Type, Optional, Any, Iterator
 
 from src.core.base.base_crawler import AbstractCrawler
-from src.spiders.platforms.xhs.core import XiaoHongShuCrawler
-from src.spiders.platforms.douyin.core import DouYinCrawler
-from src.spiders.platforms.kuaishou.core import KuaishouCrawler
+from src.spiders import platforms
+
+
+# Crawler class names by platform code; classes are named rather than
+# imported so a run only loads the platform it targets
+_CRAWLER_NAMES: Dict[str, str] = {
+    # Chinese platforms
+    "xhs": "XiaoHongShuCrawler",
+    "dy": "DouYinCrawler",
+    "ks": "KuaishouCrawler",
+    "bili": "BilibiliCrawler",
+    "wb": "WeiboCrawler",
+    "tieba": "TieBaCrawler",
+    "zhihu": "ZhihuCrawler",
+    # International platforms
+    "facebook": "FacebookCrawler",
+    "twitter": "TwitterCrawler",
+    "instagram": "InstagramCrawler",
+    "youtube": "YoutubeCrawler",
+}
+
+
+class _LazyCrawlerMap(Mapping):
+    """Platform code -> crawler class, importing each class on first lookup"""
+    
+    def __getitem__(self, platform: str) -> Type[AbstractCrawler]:
+        return getattr(platforms, _CRAWLER_NAMES[platform])
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CRAWLER_NAMES)
+    
+    def __len__(self) -> int:
+        return len(_CRAWLER_NAMES)
+    
+    def __contains__(self, platform: object) -> bool:
+        return platform in _CRAWLER_NAMES
 
 
 class CrawlerFactory:
     """Crawler factory for creating platform-specific crawlers"""
     
     # Crawler implementations mapping
-    CRAWLERS: Dict[str, Type[AbstractCrawler]] = {
-        # Chinese platforms
-        "xhs": XiaoHongShuCrawler,
-        "dy": DouYinCrawler,
-        "ks": KuaishouCrawler,
-        # Add other platforms here
-    }
+    CRAWLERS: Mapping[str, Type[AbstractCrawler]] = _LazyCrawlerMap()
     
     @staticmethod
     def create_crawler(platform: str) -> AbstractCrawler:
         """Create a crawler for the specified platform"""
-        crawler_class = CrawlerFactory.CRAWLERS.get(platform)
+        crawler_class = CrawlerFactory.get_platform_crawler_class(platform)
         if not crawler_class:
             supported = ", ".join(sorted(CrawlerFactory.CRAWLERS))
             raise ValueError(f"Invalid platform: {platform!r}. Supported: {supported}")
@@ -34,24 +62,24 @@ class CrawlerFactory:
     @staticmethod
     def get_supported_platforms() -> Dict[str, Dict[str, Any]]:
         """Get list of supported platforms with their features"""
-        platforms = {}
-        for platform_code, crawler_class in CrawlerFactory.CRAWLERS.items():
-            try:
-                crawler = crawler_class()
-                platforms[platform_code] = {
-                    "name": crawler.get_platform_name(),
-                    "features": crawler.get_supported_features(),
-                    "enabled": True
-                }
-            except Exception:
-                platforms[platform_code] = {
-                    "name": platform_code.capitalize(),
-                    "features": [],
-                    "enabled": False
-                }
-        return platforms
+        # Read class attributes directly; no crawler is instantiated
+        supported = {}
+        for platform_code in CrawlerFactory.CRAWLERS:
+            crawler_class = CrawlerFactory.get_platform_crawler_class(platform_code)
+            supported[platform_code] = {
+                "name": getattr(crawler_class, "platform_name", platform_code.capitalize()),
+                "features": list(getattr(crawler_class, "supported_features", ())),
+                "enabled": True
+            }
+        return supported
     
     @staticmethod
     def is_platform_supported(platform: str) -> bool:
         """Check if a platform is supported"""
-        return platform in CrawlerFactory.CRAWLERS
\ No newline at end of file
+        return platform in CrawlerFactory.CRAWLERS
+    
+    @staticmethod
+    def get_platform_crawler_class(platform: str) -> Optional[Type[AbstractCrawler]]:
+        """Get crawler class for a specific platform"""
+        name = _CRAWLER_NAMES.get(platform)
+        return getattr(platforms, name) if name else None
\ No newline at end of file
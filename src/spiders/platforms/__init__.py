@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 SuperCrawler Project
+# Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
+
+import importlib
+from typing import Any, List
+
+# Crawler class name -> platform subpackage; each is imported on first access
+_LAZY = {
+    "XiaoHongShuCrawler": "xhs",
+    "DouYinCrawler": "douyin",
+    "KuaishouCrawler": "kuaishou",
+    "BilibiliCrawler": "bilibili",
+    "WeiboCrawler": "weibo",
+    "TieBaCrawler": "tieba",
+    "ZhihuCrawler": "zhihu",
+    "FacebookCrawler": "facebook",
+    "TwitterCrawler": "twitter",
+    "InstagramCrawler": "instagram",
+    "YoutubeCrawler": "youtube",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a platform crawler only when it is first used"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    crawler_class = getattr(module, name)
+    # Bind the class so later lookups skip this hook
+    globals()[name] = crawler_class
+    return crawler_class
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 SuperCrawler Project
+# Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
+
+import logging
+
+from src.core.base.base_crawler_impl import BaseCrawler
+
+logger = logging.getLogger(__name__)
+
+
+class GenericStubCrawler(BaseCrawler):
+    """Placeholder crawler for platforms without a dedicated implementation"""
+    
+    async def search(self, query: str, **kwargs):
+        """Search platform content"""
+        logger.debug("Searching %s for: %s", self.platform_name, query)
+        # Implement platform-specific search logic in a subclass
+        return []
+    
+    async def get_content_detail(self, content_id: str):
+        """Get platform content detail"""
+        logger.debug("Getting %s content detail for: %s", self.platform_name, content_id)
+        # Implement platform-specific content detail logic in a subclass
+        return {}
+    
+    async def get_comments(self, content_id: str, max_comments: int = 100):
+        """Get platform comments"""
+        logger.debug("Getting %s comments for: %s", self.platform_name, content_id)
+        # Implement platform-specific comments logic in a subclass
+        return []
+    
+    async def get_user_profile(self, user_id: str):
+        """Get platform user profile"""
+        logger.debug("Getting %s user profile for: %s", self.platform_name, user_id)
+        # Implement platform-specific user profile logic in a subclass
+        return {}
+    
+    async def get_user_content(self, user_id: str, max_items: int = 50):
+        """Get platform user content"""
+        logger.debug("Getting %s user content for: %s", self.platform_name, user_id)
+        # Implement platform-specific user content logic in a subclass
+        return []
\ No newline at end of file
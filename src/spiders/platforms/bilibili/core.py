@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class BilibiliCrawler(BaseCrawler):
+class BilibiliCrawler(GenericStubCrawler):
     """Bilibili crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Bilibili"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Bilibili content"""
-        print(f"Searching Bilibili for: {query}")
-        # Implement Bilibili-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Bilibili content detail"""
-        print(f"Getting Bilibili content detail for: {content_id}")
-        # Implement Bilibili-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Bilibili comments"""
-        print(f"Getting Bilibili comments for: {content_id}")
-        # Implement Bilibili-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Bilibili user profile"""
-        print(f"Getting Bilibili user profile for: {user_id}")
-        # Implement Bilibili-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Bilibili user content"""
-        print(f"Getting Bilibili user content for: {user_id}")
-        # Implement Bilibili-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Bilibili"
\ No newline at end of file
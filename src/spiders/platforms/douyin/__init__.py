@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 SuperCrawler Project
+# Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
+
+from .core import DouYinCrawler
+
+__all__ = ["DouYinCrawler"]
\ No newline at end of file
@@ -2,23 +2,17 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
+import logging
+
 from src.core.base.base_crawler_impl import BaseCrawler
 
+logger = logging.getLogger(__name__)
+
 
 class DouYinCrawler(BaseCrawler):
     """Douyin crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Douyin"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
+    platform_name = "Douyin"
     
     async def start(self):
         """Start crawler"""
@@ -32,7 +26,7 @@ class DouYinCrawler(BaseCrawler):
     
     async def search(self, query: str, **kwargs):
         """Search Douyin content"""
-        print(f"Searching Douyin for: {query}")
+        logger.debug("Searching Douyin for: %s", query)
         
         # Douyin search API
         url = "https://api.amemv.com/aweme/v1/search/item"
@@ -58,7 +52,7 @@ class DouYinCrawler(BaseCrawler):
     
     async def get_content_detail(self, content_id: str):
         """Get Douyin content detail"""
-        print(f"Getting Douyin content detail for: {content_id}")
+        logger.debug("Getting Douyin content detail for: %s", content_id)
         
         # Douyin content detail API
         url = f"https://api.amemv.com/aweme/v1/aweme/detail"
@@ -86,7 +80,7 @@ class DouYinCrawler(BaseCrawler):
     
     async def get_comments(self, content_id: str, max_comments: int = 100):
         """Get Douyin comments"""
-        print(f"Getting Douyin comments for: {content_id}")
+        logger.debug("Getting Douyin comments for: %s", content_id)
         
         # Douyin comments API
         url = "https://api.amemv.com/aweme/v2/comment/list"
@@ -119,7 +113,7 @@ class DouYinCrawler(BaseCrawler):
     
     async def get_user_profile(self, user_id: str):
         """Get Douyin user profile"""
-        print(f"Getting Douyin user profile for: {user_id}")
+        logger.debug("Getting Douyin user profile for: %s", user_id)
         
         # Douyin user profile API
         url = "https://api.amemv.com/aweme/v1/user"
@@ -147,7 +141,7 @@ class DouYinCrawler(BaseCrawler):
     
     async def get_user_content(self, user_id: str, max_items: int = 50):
         """Get Douyin user content"""
-        print(f"Getting Douyin user content for: {user_id}")
+        logger.debug("Getting Douyin user content for: %s", user_id)
         
         # Douyin user content API
         url = "https://api.amemv.com/aweme/v1/aweme/post"
@@ -176,6 +170,8 @@ class DouYinCrawler(BaseCrawler):
                 'metadata': aweme
             }
             content_list.append(content_item)
-            await self.store_data(content_item, 'content')
+        
+        # Store the whole page with one batched write
+        await self.store_contents(content_list)
         
         return content_list
\ No newline at end of file
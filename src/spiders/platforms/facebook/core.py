@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class FacebookCrawler(BaseCrawler):
+class FacebookCrawler(GenericStubCrawler):
     """Facebook crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Facebook"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Facebook content"""
-        print(f"Searching Facebook for: {query}")
-        # Implement Facebook-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Facebook content detail"""
-        print(f"Getting Facebook content detail for: {content_id}")
-        # Implement Facebook-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Facebook comments"""
-        print(f"Getting Facebook comments for: {content_id}")
-        # Implement Facebook-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Facebook user profile"""
-        print(f"Getting Facebook user profile for: {user_id}")
-        # Implement Facebook-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Facebook user content"""
-        print(f"Getting Facebook user content for: {user_id}")
-        # Implement Facebook-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Facebook"
\ No newline at end of file
@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class InstagramCrawler(BaseCrawler):
+class InstagramCrawler(GenericStubCrawler):
     """Instagram crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Instagram"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Instagram content"""
-        print(f"Searching Instagram for: {query}")
-        # Implement Instagram-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Instagram content detail"""
-        print(f"Getting Instagram content detail for: {content_id}")
-        # Implement Instagram-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Instagram comments"""
-        print(f"Getting Instagram comments for: {content_id}")
-        # Implement Instagram-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Instagram user profile"""
-        print(f"Getting Instagram user profile for: {user_id}")
-        # Implement Instagram-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Instagram user content"""
-        print(f"Getting Instagram user content for: {user_id}")
-        # Implement Instagram-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Instagram"
\ No newline at end of file
@@ -2,23 +2,17 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
+import logging
+
 from src.core.base.base_crawler_impl import BaseCrawler
 
+logger = logging.getLogger(__name__)
+
 
 class KuaishouCrawler(BaseCrawler):
     """Kuaishou crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Kuaishou"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
+    platform_name = "Kuaishou"
     
     async def start(self):
         """Start crawler"""
@@ -32,7 +26,7 @@ class KuaishouCrawler(BaseCrawler):
     
     async def search(self, query: str, **kwargs):
         """Search Kuaishou content"""
-        print(f"Searching Kuaishou for: {query}")
+        logger.debug("Searching Kuaishou for: %s", query)
         
         # Kuaishou search API
         url = "https://api.kuaishou.com/graphql"
@@ -84,7 +78,7 @@ class KuaishouCrawler(BaseCrawler):
     
     async def get_content_detail(self, content_id: str):
         """Get Kuaishou content detail"""
-        print(f"Getting Kuaishou content detail for: {content_id}")
+        logger.debug("Getting Kuaishou content detail for: %s", content_id)
         
         # Kuaishou content detail API
         url = "https://api.kuaishou.com/graphql"
@@ -134,7 +128,7 @@ class KuaishouCrawler(BaseCrawler):
     
     async def get_comments(self, content_id: str, max_comments: int = 100):
         """Get Kuaishou comments"""
-        print(f"Getting Kuaishou comments for: {content_id}")
+        logger.debug("Getting Kuaishou comments for: %s", content_id)
         
         # Kuaishou comments API
         url = "https://api.kuaishou.com/graphql"
@@ -189,7 +183,7 @@ class KuaishouCrawler(BaseCrawler):
     
     async def get_user_profile(self, user_id: str):
         """Get Kuaishou user profile"""
-        print(f"Getting Kuaishou user profile for: {user_id}")
+        logger.debug("Getting Kuaishou user profile for: %s", user_id)
         
         # Kuaishou user profile API
         url = "https://api.kuaishou.com/graphql"
@@ -232,7 +226,7 @@ class KuaishouCrawler(BaseCrawler):
     
     async def get_user_content(self, user_id: str, max_items: int = 50):
         """Get Kuaishou user content"""
-        print(f"Getting Kuaishou user content for: {user_id}")
+        logger.debug("Getting Kuaishou user content for: %s", user_id)
         
         # Kuaishou user content API
         url = "https://api.kuaishou.com/graphql"
@@ -287,6 +281,8 @@ class KuaishouCrawler(BaseCrawler):
                 'metadata': feed
             }
             content_list.append(content_item)
-            await self.store_data(content_item, 'content')
+        
+        # Store the whole page with one batched write
+        await self.store_contents(content_list)
         
         return content_list
\ No newline at end of file
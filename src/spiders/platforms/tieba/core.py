@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class TieBaCrawler(BaseCrawler):
+class TieBaCrawler(GenericStubCrawler):
     """Tieba crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Tieba"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Tieba content"""
-        print(f"Searching Tieba for: {query}")
-        # Implement Tieba-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Tieba content detail"""
-        print(f"Getting Tieba content detail for: {content_id}")
-        # Implement Tieba-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Tieba comments"""
-        print(f"Getting Tieba comments for: {content_id}")
-        # Implement Tieba-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Tieba user profile"""
-        print(f"Getting Tieba user profile for: {user_id}")
-        # Implement Tieba-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Tieba user content"""
-        print(f"Getting Tieba user content for: {user_id}")
-        # Implement Tieba-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Tieba"
\ No newline at end of file
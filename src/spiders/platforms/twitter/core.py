@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class TwitterCrawler(BaseCrawler):
+class TwitterCrawler(GenericStubCrawler):
     """Twitter crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Twitter"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Twitter content"""
-        print(f"Searching Twitter for: {query}")
-        # Implement Twitter-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Twitter content detail"""
-        print(f"Getting Twitter content detail for: {content_id}")
-        # Implement Twitter-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Twitter comments"""
-        print(f"Getting Twitter comments for: {content_id}")
-        # Implement Twitter-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Twitter user profile"""
-        print(f"Getting Twitter user profile for: {user_id}")
-        # Implement Twitter-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Twitter user content"""
-        print(f"Getting Twitter user content for: {user_id}")
-        # Implement Twitter-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Twitter"
\ No newline at end of file
@@ -2,52 +2,20 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class WeiboCrawler(BaseCrawler):
+class WeiboCrawler(GenericStubCrawler):
     """Weibo crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Weibo"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login",
-            "store_image",
-            "store_video"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Weibo content"""
-        print(f"Searching Weibo for: {query}")
-        # Implement Weibo-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Weibo content detail"""
-        print(f"Getting Weibo content detail for: {content_id}")
-        # Implement Weibo-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Weibo comments"""
-        print(f"Getting Weibo comments for: {content_id}")
-        # Implement Weibo-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Weibo user profile"""
-        print(f"Getting Weibo user profile for: {user_id}")
-        # Implement Weibo-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Weibo user content"""
-        print(f"Getting Weibo user content for: {user_id}")
-        # Implement Weibo-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Weibo"
+    supported_features = (
+        "search",
+        "content_detail",
+        "comments",
+        "user_profile",
+        "user_content",
+        "login",
+        "store_image",
+        "store_video"
+    )
\ No newline at end of file
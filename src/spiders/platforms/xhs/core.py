@@ -2,23 +2,17 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
+import logging
+
 from src.core.base.base_crawler_impl import BaseCrawler
 
+logger = logging.getLogger(__name__)
+
 
 class XiaoHongShuCrawler(BaseCrawler):
     """Xiaohongshu crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Xiaohongshu"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
+    platform_name = "Xiaohongshu"
     
     async def start(self):
         """Start crawler"""
@@ -32,7 +26,7 @@ class XiaoHongShuCrawler(BaseCrawler):
     
     async def search(self, query: str, **kwargs):
         """Search Xiaohongshu content"""
-        print(f"Searching Xiaohongshu for: {query}")
+        logger.debug("Searching Xiaohongshu for: %s", query)
         
         # Xiaohongshu search API
         url = "https://www.xiaohongshu.com/api/sns/v3/search/notes"
@@ -58,7 +52,7 @@ class XiaoHongShuCrawler(BaseCrawler):
     
     async def get_content_detail(self, content_id: str):
         """Get Xiaohongshu content detail"""
-        print(f"Getting Xiaohongshu content detail for: {content_id}")
+        logger.debug("Getting Xiaohongshu content detail for: %s", content_id)
         
         # Xiaohongshu content detail API
         url = f"https://www.xiaohongshu.com/api/sns/v3/notes/{content_id}"
@@ -83,7 +77,7 @@ class XiaoHongShuCrawler(BaseCrawler):
     
     async def get_comments(self, content_id: str, max_comments: int = 100):
         """Get Xiaohongshu comments"""
-        print(f"Getting Xiaohongshu comments for: {content_id}")
+        logger.debug("Getting Xiaohongshu comments for: %s", content_id)
         
         # Xiaohongshu comments API
         url = f"https://www.xiaohongshu.com/api/sns/v3/notes/{content_id}/comments"
@@ -115,7 +109,7 @@ class XiaoHongShuCrawler(BaseCrawler):
     
     async def get_user_profile(self, user_id: str):
         """Get Xiaohongshu user profile"""
-        print(f"Getting Xiaohongshu user profile for: {user_id}")
+        logger.debug("Getting Xiaohongshu user profile for: %s", user_id)
         
         # Xiaohongshu user profile API
         url = f"https://www.xiaohongshu.com/api/sns/v3/user/{user_id}"
@@ -140,7 +134,7 @@ class XiaoHongShuCrawler(BaseCrawler):
     
     async def get_user_content(self, user_id: str, max_items: int = 50):
         """Get Xiaohongshu user content"""
-        print(f"Getting Xiaohongshu user content for: {user_id}")
+        logger.debug("Getting Xiaohongshu user content for: %s", user_id)
         
         # Xiaohongshu user content API
         url = f"https://www.xiaohongshu.com/api/sns/v3/user/{user_id}/notes"
@@ -168,6 +162,8 @@ class XiaoHongShuCrawler(BaseCrawler):
                 'metadata': note
             }
             content_list.append(content_item)
-            await self.store_data(content_item, 'content')
+        
+        # Store the whole page with one batched write
+        await self.store_contents(content_list)
         
         return content_list
\ No newline at end of file
@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class YoutubeCrawler(BaseCrawler):
+class YoutubeCrawler(GenericStubCrawler):
     """YouTube crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "YouTube"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search YouTube content"""
-        print(f"Searching YouTube for: {query}")
-        # Implement YouTube-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get YouTube content detail"""
-        print(f"Getting YouTube content detail for: {content_id}")
-        # Implement YouTube-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get YouTube comments"""
-        print(f"Getting YouTube comments for: {content_id}")
-        # Implement YouTube-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get YouTube user profile"""
-        print(f"Getting YouTube user profile for: {user_id}")
-        # Implement YouTube-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get YouTube user content"""
-        print(f"Getting YouTube user content for: {user_id}")
-        # Implement YouTube-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "YouTube"
\ No newline at end of file
@@ -2,50 +2,10 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from base.base_crawler_impl import BaseCrawler
+from src.spiders.platforms._generic import GenericStubCrawler
 
 
-class ZhihuCrawler(BaseCrawler):
+class ZhihuCrawler(GenericStubCrawler):
     """Zhihu crawler implementation"""
     
-    def __init__(self):
-        super().__init__()
-        self.platform_name = "Zhihu"
-        self.supported_features = [
-            "search",
-            "content_detail",
-            "comments",
-            "user_profile",
-            "user_content",
-            "login"
-        ]
-    
-    async def search(self, query: str, **kwargs):
-        """Search Zhihu content"""
-        print(f"Searching Zhihu for: {query}")
-        # Implement Zhihu-specific search logic
-        return []
-    
-    async def get_content_detail(self, content_id: str):
-        """Get Zhihu content detail"""
-        print(f"Getting Zhihu content detail for: {content_id}")
-        # Implement Zhihu-specific content detail logic
-        return {}
-    
-    async def get_comments(self, content_id: str, max_comments: int = 100):
-        """Get Zhihu comments"""
-        print(f"Getting Zhihu comments for: {content_id}")
-        # Implement Zhihu-specific comments logic
-        return []
-    
-    async def get_user_profile(self, user_id: str):
-        """Get Zhihu user profile"""
-        print(f"Getting Zhihu user profile for: {user_id}")
-        # Implement Zhihu-specific user profile logic
-        return {}
-    
-    async def get_user_content(self, user_id: str, max_items: int = 50):
-        """Get Zhihu user content"""
-        print(f"Getting Zhihu user content for: {user_id}")
-        # Implement Zhihu-specific user content logic
-        return []
\ No newline at end of file
+    platform_name = "Zhihu"
\ No newline at end of file
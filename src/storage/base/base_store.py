@@ -22,6 +22,12 @@ class BaseStore(AbstractStore):
         """Store content item"""
         pass
     
+    async def store_contents(self, content_items: List[Dict[str, Any]]):
+        """Store a batch of content items"""
+        # Stores without a native batch path fall back to one write per item
+        for content_item in content_items:
+            await self.store_content(content_item)
+    
     async def store_comment(self, comment_item: Dict[str, Any]):
         """Store comment item"""
         pass
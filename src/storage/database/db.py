@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 SuperCrawler Project
+# Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
+
+import logging
+from typing import Dict, Optional, Any, List, Protocol
+
+from src.storage.factory import StoreFactory
+
+logger = logging.getLogger("supercrawler.db")
+
+
+class DatabaseNotInitializedError(RuntimeError):
+    """Raised when the database is used before init_db"""
+
+
+class Database(Protocol):
+    """Operations the facade needs from a backing store"""
+    
+    async def initialize(self): ...
+    
+    async def store_content(self, content_item: Dict[str, Any]): ...
+    
+    async def store_comment(self, comment_item: Dict[str, Any]): ...
+    
+    async def store_creator(self, creator: Dict[str, Any]): ...
+    
+    async def get_content_by_id(self, content_id: str) -> Optional[Dict[str, Any]]: ...
+    
+    async def get_comments_by_content_id(self, content_id: str) -> List[Dict[str, Any]]: ...
+    
+    async def get_creator_by_id(self, creator_id: str) -> Optional[Dict[str, Any]]: ...
+    
+    async def close(self): ...
+
+
+class _Uninitialized:
+    """Placeholder bound to db until init_db is called"""
+    
+    def __getattr__(self, name: str) -> Any:
+        raise DatabaseNotInitializedError("Database not initialized")
+    
+    def __bool__(self) -> bool:
+        return False
+
+
+# Active database store; rebound by init_db and close so the wrappers
+# below can use it directly without a lookup helper or None check
+db: Database = _Uninitialized()
+
+
+async def init_db(db_type: str, **kwargs) -> Database:
+    """Initialize the database store"""
+    global db
+    store = StoreFactory.create_store(db_type, **kwargs)
+    await store.initialize()
+    db = store
+    logger.info("%s database initialized", db_type)
+    return store
+
+
+async def close():
+    """Close the database store"""
+    global db
+    if not db:
+        return
+    await db.close()
+    db = _Uninitialized()
+    logger.info("Database connection closed")
+
+
+async def store_content(content_item: Dict[str, Any]):
+    """Store content item"""
+    return await db.store_content(content_item)
+
+
+async def store_comment(comment_item: Dict[str, Any]):
+    """Store comment item"""
+    return await db.store_comment(comment_item)
+
+
+async def store_creator(creator: Dict[str, Any]):
+    """Store creator information"""
+    return await db.store_creator(creator)
+
+
+async def get_content_by_id(content_id: str) -> Optional[Dict[str, Any]]:
+    """Get content by ID"""
+    return await db.get_content_by_id(content_id)
+
+
+async def get_comments_by_content_id(content_id: str) -> List[Dict[str, Any]]:
+    """Get comments by content ID"""
+    return await db.get_comments_by_content_id(content_id)
+
+
+async def get_creator_by_id(creator_id: str) -> Optional[Dict[str, Any]]:
+    """Get creator by ID"""
+    return await db.get_creator_by_id(creator_id)
\ No newline at end of file
@@ -2,28 +2,67 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-from pymongo import MongoClient
+import asyncio
+
+from pymongo import AsyncMongoClient, IndexModel, UpdateOne, WriteConcern
 from typing import Dict, Optional, Any, List
 
+from src.config import base_config
 from src.storage.base.base_store import BaseStore, BaseStoreImage, BaseStoreVideo
 
 
+def _create_client(connection_string: str) -> AsyncMongoClient:
+    """Create an async client with the configured connection pool"""
+    # minPoolSize keeps warm connections open in the background so bursts
+    # don't pay connect and auth round-trips; short timeouts make an
+    # unreachable server fail fast instead of stalling the crawl
+    timeout_ms = base_config.DB_CONNECT_TIMEOUT * 1000
+    return AsyncMongoClient(
+        connection_string,
+        minPoolSize=base_config.DB_POOL_MIN,
+        maxPoolSize=base_config.DB_POOL_MAX,
+        connectTimeoutMS=timeout_ms,
+        serverSelectionTimeoutMS=timeout_ms
+    )
+
+
 class MongoDBStore(BaseStore):
     """MongoDB store implementation"""
     
-    def __init__(self, connection_string: str = "mongodb://localhost:27017", db_name: str = "supercrawler"):
+    def __init__(self, connection_string: str = "mongodb://localhost:27017", db_name: str = "supercrawler",
+                 fast_write: Optional[bool] = None):
         super().__init__()
         self.connection_string = connection_string
         self.db_name = db_name
+        # Unacknowledged (w=0) writes for bulk ingestion; writes can be lost
+        # on a primary step-down or network error, and errors are not reported.
+        # Off unless enabled here or through MONGODB_FAST_WRITE
+        self.fast_write = base_config.MONGODB_FAST_WRITE if fast_write is None else fast_write
         self.client = None
         self.db = None
     
     async def initialize(self):
         """Initialize MongoDB store"""
         await super().initialize()
-        # Connect to MongoDB
-        self.client = MongoClient(self.connection_string)
-        self.db = self.client[self.db_name]
+        # Create the async client with a pre-warmed connection pool
+        self.client = _create_client(self.connection_string)
+        if self.fast_write:
+            self.db = self.client.get_database(self.db_name, write_concern=WriteConcern(w=0))
+        else:
+            self.db = self.client[self.db_name]
+        
+        # Index the lookup keys; one create_indexes command per collection,
+        # issued concurrently
+        await asyncio.gather(
+            self.db.content.create_indexes([IndexModel("id", unique=True)]),
+            self.db.comments.create_indexes([IndexModel("id", unique=True), IndexModel("content_id")]),
+            self.db.creators.create_indexes([IndexModel("id", unique=True)])
+        )
+    
+    async def flush(self):
+        """Round-trip to the server, e.g. at a checkpoint after fast writes"""
+        if self.client:
+            await self.client.admin.command("ping")
     
     async def store_content(self, content_item: Dict[str, Any]):
         """Store content item to MongoDB"""
@@ -31,19 +70,34 @@ class MongoDBStore(BaseStore):
             await self.initialize()
         
         # Insert or update content
-        self.db.content.update_one(
+        await self.db.content.update_one(
             {"id": content_item.get("id")},
             {"$set": content_item},
             upsert=True
         )
     
+    async def store_contents(self, content_items: List[Dict[str, Any]]):
+        """Store a batch of content items to MongoDB in one bulk write"""
+        if not self.connected:
+            await self.initialize()
+        
+        if not content_items:
+            return
+        
+        # Upsert by id so re-crawled items update in place; unordered so one
+        # failing item doesn't stop the rest of the batch
+        await self.db.content.bulk_write(
+            [UpdateOne({"id": item.get("id")}, {"$set": item}, upsert=True) for item in content_items],
+            ordered=False
+        )
+    
     async def store_comment(self, comment_item: Dict[str, Any]):
         """Store comment item to MongoDB"""
         if not self.connected:
             await self.initialize()
         
         # Insert or update comment
-        self.db.comments.update_one(
+        await self.db.comments.update_one(
             {"id": comment_item.get("id")},
             {"$set": comment_item},
             upsert=True
@@ -55,7 +109,7 @@ class MongoDBStore(BaseStore):
             await self.initialize()
         
         # Insert or update creator
-        self.db.creators.update_one(
+        await self.db.creators.update_one(
             {"id": creator.get("id")},
             {"$set": creator},
             upsert=True
@@ -67,7 +121,7 @@ class MongoDBStore(BaseStore):
             await self.initialize()
         
         # Find content by ID
-        content = self.db.content.find_one({"id": content_id})
+        content = await self.db.content.find_one({"id": content_id})
         if content:
             # Convert ObjectId to string
             if "_id" in content:
@@ -80,14 +134,9 @@ class MongoDBStore(BaseStore):
         if not self.connected:
             await self.initialize()
         
-        # Find comments by content ID
-        comments = []
-        for comment in self.db.comments.find({"content_id": content_id}):
-            # Convert ObjectId to string
-            if "_id" in comment:
-                comment["_id"] = str(comment["_id"])
-            comments.append(comment)
-        return comments
+        # Fetch all matching comments in one go, converting ObjectId to string
+        comments = await self.db.comments.find({"content_id": content_id}).to_list()
+        return [{**comment, "_id": str(comment["_id"])} for comment in comments]
     
     async def get_creator_by_id(self, creator_id: str) -> Optional[Dict[str, Any]]:
         """Get creator by ID from MongoDB"""
@@ -95,7 +144,7 @@ class MongoDBStore(BaseStore):
             await self.initialize()
         
         # Find creator by ID
-        creator = self.db.creators.find_one({"id": creator_id})
+        creator = await self.db.creators.find_one({"id": creator_id})
         if creator:
             # Convert ObjectId to string
             if "_id" in creator:
@@ -106,7 +155,10 @@ class MongoDBStore(BaseStore):
     async def close(self):
         """Close MongoDB store"""
         if self.client:
-            self.client.close()
+            # Last round-trip so unacknowledged writes reach the server first
+            if self.fast_write:
+                await self.flush()
+            await self.client.close()
             self.client = None
             self.db = None
         await super().close()
@@ -125,9 +177,10 @@ class MongoDBStoreImage(BaseStoreImage):
     async def initialize(self):
         """Initialize MongoDB store image"""
         await super().initialize()
-        # Connect to MongoDB
-        self.client = MongoClient(self.connection_string)
+        # Create the async client with a pre-warmed connection pool
+        self.client = _create_client(self.connection_string)
         self.db = self.client[self.db_name]
+        await self.db.images.create_index("id", unique=True)
     
     async def store_image(self, image_content_item: Dict[str, Any]):
         """Store image content to MongoDB"""
@@ -135,7 +188,7 @@ class MongoDBStoreImage(BaseStoreImage):
             await self.initialize()
         
         # Insert or update image
-        self.db.images.update_one(
+        await self.db.images.update_one(
             {"id": image_content_item.get("id")},
             {"$set": image_content_item},
             upsert=True
@@ -147,7 +200,7 @@ class MongoDBStoreImage(BaseStoreImage):
             await self.initialize()
         
         # Find image by ID
-        image = self.db.images.find_one({"id": image_id})
+        image = await self.db.images.find_one({"id": image_id})
         if image:
             # Convert ObjectId to string
             if "_id" in image:
@@ -158,7 +211,7 @@ class MongoDBStoreImage(BaseStoreImage):
     async def close(self):
         """Close MongoDB store image"""
         if self.client:
-            self.client.close()
+            await self.client.close()
             self.client = None
             self.db = None
         await super().close()
@@ -177,9 +230,10 @@ class MongoDBStoreVideo(BaseStoreVideo):
     async def initialize(self):
         """Initialize MongoDB store video"""
         await super().initialize()
-        # Connect to MongoDB
-        self.client = MongoClient(self.connection_string)
+        # Create the async client with a pre-warmed connection pool
+        self.client = _create_client(self.connection_string)
         self.db = self.client[self.db_name]
+        await self.db.videos.create_index("id", unique=True)
     
     async def store_video(self, video_content_item: Dict[str, Any]):
         """Store video content to MongoDB"""
@@ -187,7 +241,7 @@ class MongoDBStoreVideo(BaseStoreVideo):
             await self.initialize()
         
         # Insert or update video
-        self.db.videos.update_one(
+        await self.db.videos.update_one(
             {"id": video_content_item.get("id")},
             {"$set": video_content_item},
             upsert=True
@@ -199,7 +253,7 @@ class MongoDBStoreVideo(BaseStoreVideo):
             await self.initialize()
         
         # Find video by ID
-        video = self.db.videos.find_one({"id": video_id})
+        video = await self.db.videos.find_one({"id": video_id})
         if video:
             # Convert ObjectId to string
             if "_id" in video:
@@ -210,7 +264,7 @@ class MongoDBStoreVideo(BaseStoreVideo):
     async def close(self):
         """Close MongoDB store video"""
         if self.client:
-            self.client.close()
+            await self.client.close()
             self.client = None
             self.db = None
         await super().close()
\ No newline at end of file
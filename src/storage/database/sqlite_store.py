@@ -2,13 +2,69 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-import sqlite3
-import json
-from typing import Dict, Optional, Any, List
+import aiosqlite
+import asyncio
+import contextlib
+import orjson
+from typing import Dict, Optional, Any, List, AsyncIterator
 
+from src.config import base_config
 from src.storage.base.base_store import BaseStore, BaseStoreImage, BaseStoreVideo
 
 
+# INSERT statements shared by the single-row and batch write paths
+_INSERT_CONTENT_SQL = (
+    "INSERT OR REPLACE INTO content (id, title, content, author, platform, created_at, url, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_COMMENT_SQL = (
+    "INSERT OR REPLACE INTO comments (id, content_id, author, content, created_at, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_CREATOR_SQL = (
+    "INSERT OR REPLACE INTO creators (id, name, username, platform, followers, following, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_IMAGE_SQL = (
+    "INSERT OR REPLACE INTO images (id, content_id, url, local_path, width, height, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_VIDEO_SQL = (
+    "INSERT OR REPLACE INTO videos (id, content_id, url, local_path, duration, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+async def _connect(db_path: str) -> aiosqlite.Connection:
+    """Open an SQLite connection tuned for the crawler's append-heavy writes"""
+    # Autocommit mode: sqlite3 never opens a transaction implicitly, and
+    # SQLiteStore writes open an explicit BEGIN IMMEDIATE through transaction()
+    conn = await aiosqlite.connect(db_path, isolation_level=None)
+    conn.row_factory = aiosqlite.Row
+    # WAL lets readers proceed during writes and avoids a journal fsync per
+    # commit; NORMAL sync is durable across application crashes in WAL mode
+    await conn.execute("PRAGMA journal_mode=WAL")
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    await conn.execute("PRAGMA temp_store=MEMORY")
+    await conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+def _dumps(value: Any) -> str:
+    """Encode a metadata value as compact JSON"""
+    # orjson emits compact UTF-8 without escaping non-ASCII text
+    return orjson.dumps(value).decode()
+
+
+def _row_to_dict(row: aiosqlite.Row) -> Dict[str, Any]:
+    """Convert a fetched row, decoding its JSON metadata column"""
+    result = dict(row)
+    # metadata is the only JSON-encoded column in every table
+    metadata = result.get('metadata')
+    result['metadata'] = orjson.loads(metadata) if metadata else {}
+    return result
+
+
 class SQLiteStore(BaseStore):
     """SQLite store implementation"""
     
@@ -16,19 +72,20 @@ class SQLiteStore(BaseStore):
         super().__init__()
         self.db_path = db_path
         self.conn = None
+        # All writes share one connection, so only one transaction may be open
+        # at a time; the owning task can nest transaction() inside it
+        self._write_lock = asyncio.Lock()
+        self._transaction_owner: Optional[asyncio.Task] = None
     
     async def initialize(self):
         """Initialize SQLite store"""
         await super().initialize()
         # Connect to SQLite database
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = await _connect(self.db_path)
         
         # Create tables if they don't exist
-        cursor = self.conn.cursor()
-        
         # Create content table
-        cursor.execute('''
+        await self.conn.execute('''
         CREATE TABLE IF NOT EXISTS content (
             id TEXT PRIMARY KEY,
             title TEXT,
@@ -42,7 +99,7 @@ class SQLiteStore(BaseStore):
         ''')
         
         # Create comments table
-        cursor.execute('''
+        await self.conn.execute('''
         CREATE TABLE IF NOT EXISTS comments (
             id TEXT PRIMARY KEY,
             content_id TEXT,
@@ -55,7 +112,7 @@ class SQLiteStore(BaseStore):
         ''')
         
         # Create creators table
-        cursor.execute('''
+        await self.conn.execute('''
         CREATE TABLE IF NOT EXISTS creators (
             id TEXT PRIMARY KEY,
             name TEXT,
@@ -66,21 +123,61 @@ class SQLiteStore(BaseStore):
             metadata TEXT
         )
         ''')
+    
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator["SQLiteStore"]:
+        """Group several writes into a single transaction and commit"""
+        if not self.connected:
+            await self.initialize()
         
-        self.conn.commit()
+        # Nested use by the same task joins its outer transaction
+        if self._transaction_owner is asyncio.current_task():
+            yield self
+            return
+        
+        # Other tasks wait here rather than writing into this transaction
+        async with self._write_lock:
+            # Take the write lock up front so the batch can't fail midway on a
+            # read-to-write lock upgrade
+            await self.conn.execute("BEGIN IMMEDIATE")
+            self._transaction_owner = asyncio.current_task()
+            try:
+                yield self
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            else:
+                await self.conn.commit()
+            finally:
+                self._transaction_owner = None
     
     async def store_content(self, content_item: Dict[str, Any]):
         """Store content item to SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        metadata = json.dumps(content_item.get('metadata', {}))
+        async with self.transaction():
+            await self.conn.execute(_INSERT_CONTENT_SQL, self._content_row(content_item))
+    
+    async def store_contents(self, content_items: List[Dict[str, Any]]):
+        """Store a batch of content items to SQLite in one transaction"""
+        if not self.connected:
+            await self.initialize()
         
-        cursor.execute('''
-        INSERT OR REPLACE INTO content (id, title, content, author, platform, created_at, url, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        # Bind rows in bounded chunks so a large batch never builds one huge
+        # parameter list; the whole batch still commits once
+        batch_size = base_config.INSERT_BATCH_SIZE
+        async with self.transaction():
+            for start in range(0, len(content_items), batch_size):
+                await self.conn.executemany(
+                    _INSERT_CONTENT_SQL,
+                    (self._content_row(content_item) for content_item in content_items[start:start + batch_size])
+                )
+    
+    @staticmethod
+    def _content_row(content_item: Dict[str, Any]) -> tuple:
+        """Build the content table row for a content item"""
+        return (
             content_item.get('id'),
             content_item.get('title'),
             content_item.get('content'),
@@ -88,106 +185,78 @@ class SQLiteStore(BaseStore):
             content_item.get('platform'),
             content_item.get('created_at'),
             content_item.get('url'),
-            metadata
-        ))
-        
-        self.conn.commit()
+            _dumps(content_item.get('metadata', {}))
+        )
     
     async def store_comment(self, comment_item: Dict[str, Any]):
         """Store comment item to SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        metadata = json.dumps(comment_item.get('metadata', {}))
-        
-        cursor.execute('''
-        INSERT OR REPLACE INTO comments (id, content_id, author, content, created_at, metadata)
-        VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            comment_item.get('id'),
-            comment_item.get('content_id'),
-            comment_item.get('author'),
-            comment_item.get('content'),
-            comment_item.get('created_at'),
-            metadata
-        ))
-        
-        self.conn.commit()
+        metadata = _dumps(comment_item.get('metadata', {}))
+        
+        async with self.transaction():
+            await self.conn.execute(_INSERT_COMMENT_SQL, (
+                comment_item.get('id'),
+                comment_item.get('content_id'),
+                comment_item.get('author'),
+                comment_item.get('content'),
+                comment_item.get('created_at'),
+                metadata
+            ))
     
     async def store_creator(self, creator: Dict[str, Any]):
         """Store creator information to SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        metadata = json.dumps(creator.get('metadata', {}))
-        
-        cursor.execute('''
-        INSERT OR REPLACE INTO creators (id, name, username, platform, followers, following, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            creator.get('id'),
-            creator.get('name'),
-            creator.get('username'),
-            creator.get('platform'),
-            creator.get('followers', 0),
-            creator.get('following', 0),
-            metadata
-        ))
-        
-        self.conn.commit()
+        metadata = _dumps(creator.get('metadata', {}))
+        
+        async with self.transaction():
+            await self.conn.execute(_INSERT_CREATOR_SQL, (
+                creator.get('id'),
+                creator.get('name'),
+                creator.get('username'),
+                creator.get('platform'),
+                creator.get('followers', 0),
+                creator.get('following', 0),
+                metadata
+            ))
     
     async def get_content_by_id(self, content_id: str) -> Optional[Dict[str, Any]]:
         """Get content by ID from SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM content WHERE id = ?', (content_id,))
-        row = cursor.fetchone()
+        async with self.conn.execute('SELECT * FROM content WHERE id = ?', (content_id,)) as cursor:
+            row = await cursor.fetchone()
         
-        if row:
-            result = dict(row)
-            result['metadata'] = json.loads(result['metadata']) if result['metadata'] else {}
-            return result
-        return None
+        return _row_to_dict(row) if row else None
     
     async def get_comments_by_content_id(self, content_id: str) -> List[Dict[str, Any]]:
         """Get comments by content ID from SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM comments WHERE content_id = ?', (content_id,))
-        rows = cursor.fetchall()
+        async with self.conn.execute('SELECT * FROM comments WHERE content_id = ?', (content_id,)) as cursor:
+            rows = await cursor.fetchall()
         
-        result = []
-        for row in rows:
-            comment = dict(row)
-            comment['metadata'] = json.loads(comment['metadata']) if comment['metadata'] else {}
-            result.append(comment)
-        return result
+        return [_row_to_dict(row) for row in rows]
     
     async def get_creator_by_id(self, creator_id: str) -> Optional[Dict[str, Any]]:
         """Get creator by ID from SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM creators WHERE id = ?', (creator_id,))
-        row = cursor.fetchone()
+        async with self.conn.execute('SELECT * FROM creators WHERE id = ?', (creator_id,)) as cursor:
+            row = await cursor.fetchone()
         
-        if row:
-            result = dict(row)
-            result['metadata'] = json.loads(result['metadata']) if result['metadata'] else {}
-            return result
-        return None
+        return _row_to_dict(row) if row else None
     
     async def close(self):
         """Close SQLite store"""
         if self.conn:
-            self.conn.close()
+            await self.conn.close()
             self.conn = None
         await super().close()
 
@@ -204,13 +273,10 @@ class SQLiteStoreImage(BaseStoreImage):
         """Initialize SQLite store image"""
         await super().initialize()
         # Connect to SQLite database
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = await _connect(self.db_path)
         
         # Create images table if it doesn't exist
-        cursor = self.conn.cursor()
-        
-        cursor.execute('''
+        await self.conn.execute('''
         CREATE TABLE IF NOT EXISTS images (
             id TEXT PRIMARY KEY,
             content_id TEXT,
@@ -222,21 +288,15 @@ class SQLiteStoreImage(BaseStoreImage):
             FOREIGN KEY (content_id) REFERENCES content (id)
         )
         ''')
-        
-        self.conn.commit()
     
     async def store_image(self, image_content_item: Dict[str, Any]):
         """Store image content to SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        metadata = json.dumps(image_content_item.get('metadata', {}))
+        metadata = _dumps(image_content_item.get('metadata', {}))
         
-        cursor.execute('''
-        INSERT OR REPLACE INTO images (id, content_id, url, local_path, width, height, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        await self.conn.execute(_INSERT_IMAGE_SQL, (
             image_content_item.get('id'),
             image_content_item.get('content_id'),
             image_content_item.get('url'),
@@ -245,28 +305,21 @@ class SQLiteStoreImage(BaseStoreImage):
             image_content_item.get('height'),
             metadata
         ))
-        
-        self.conn.commit()
     
     async def get_image_by_id(self, image_id: str) -> Optional[Dict[str, Any]]:
         """Get image by ID from SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM images WHERE id = ?', (image_id,))
-        row = cursor.fetchone()
+        async with self.conn.execute('SELECT * FROM images WHERE id = ?', (image_id,)) as cursor:
+            row = await cursor.fetchone()
         
-        if row:
-            result = dict(row)
-            result['metadata'] = json.loads(result['metadata']) if result['metadata'] else {}
-            return result
-        return None
+        return _row_to_dict(row) if row else None
     
     async def close(self):
         """Close SQLite store image"""
         if self.conn:
-            self.conn.close()
+            await self.conn.close()
             self.conn = None
         await super().close()
 
@@ -283,13 +336,10 @@ class SQLiteStoreVideo(BaseStoreVideo):
         """Initialize SQLite store video"""
         await super().initialize()
         # Connect to SQLite database
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = await _connect(self.db_path)
         
         # Create videos table if it doesn't exist
-        cursor = self.conn.cursor()
-        
-        cursor.execute('''
+        await self.conn.execute('''
         CREATE TABLE IF NOT EXISTS videos (
             id TEXT PRIMARY KEY,
             content_id TEXT,
@@ -300,21 +350,15 @@ class SQLiteStoreVideo(BaseStoreVideo):
             FOREIGN KEY (content_id) REFERENCES content (id)
         )
         ''')
-        
-        self.conn.commit()
     
     async def store_video(self, video_content_item: Dict[str, Any]):
         """Store video content to SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        metadata = json.dumps(video_content_item.get('metadata', {}))
+        metadata = _dumps(video_content_item.get('metadata', {}))
         
-        cursor.execute('''
-        INSERT OR REPLACE INTO videos (id, content_id, url, local_path, duration, metadata)
-        VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
+        await self.conn.execute(_INSERT_VIDEO_SQL, (
             video_content_item.get('id'),
             video_content_item.get('content_id'),
             video_content_item.get('url'),
@@ -322,27 +366,20 @@ class SQLiteStoreVideo(BaseStoreVideo):
             video_content_item.get('duration'),
             metadata
         ))
-        
-        self.conn.commit()
     
     async def get_video_by_id(self, video_id: str) -> Optional[Dict[str, Any]]:
         """Get video by ID from SQLite"""
         if not self.connected:
             await self.initialize()
         
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM videos WHERE id = ?', (video_id,))
-        row = cursor.fetchone()
+        async with self.conn.execute('SELECT * FROM videos WHERE id = ?', (video_id,)) as cursor:
+            row = await cursor.fetchone()
         
-        if row:
-            result = dict(row)
-            result['metadata'] = json.loads(result['metadata']) if result['metadata'] else {}
-            return result
-        return None
+        return _row_to_dict(row) if row else None
     
     async def close(self):
         """Close SQLite store video"""
         if self.conn:
-            self.conn.close()
+            await self.conn.close()
             self.conn = None
         await super().close()
\ No newline at end of file
@@ -2,15 +2,32 @@
 # Copyright (c) 2025 SuperCrawler Project
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
-import json
+import asyncio
 import csv
+import orjson
 import os
+import uuid
 import aiofiles
-from typing import Dict, Optional, Any, List
+import aiofiles.os
+from typing import Dict, Optional, Any, List, Tuple
 
 from src.storage.base.base_store import BaseStore, BaseStoreImage, BaseStoreVideo
 
 
+async def _write_json_atomic(file_path: str, items: List[Dict[str, Any]]):
+    """Write a JSON list file via a temp file, so a crash never leaves it truncated"""
+    # A temp file per write, so overlapping writers never replace each other's
+    tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        async with aiofiles.open(tmp_path, 'wb') as f:
+            await f.write(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+        await aiofiles.os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class FileStore(BaseStore):
     """File store implementation"""
     
@@ -20,6 +37,50 @@ class FileStore(BaseStore):
         self.content_file = os.path.join(output_dir, "content.json")
         self.comments_file = os.path.join(output_dir, "comments.json")
         self.creators_file = os.path.join(output_dir, "creators.json")
+        # Parsed file contents keyed by path, with the mtime they were read at
+        self._cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        # One read-append-write at a time per file, or concurrent appends are lost
+        self._locks: Dict[str, asyncio.Lock] = {
+            file_path: asyncio.Lock()
+            for file_path in (self.content_file, self.comments_file, self.creators_file)
+        }
+    
+    async def _read(self, file_path: str) -> List[Dict[str, Any]]:
+        """Read a JSON list file, reusing the parsed copy while it is unchanged"""
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        async with aiofiles.open(file_path, 'rb') as f:
+            items = orjson.loads(await f.read())
+        self._cache[file_path] = (mtime, items)
+        return items
+    
+    async def _write(self, file_path: str, items: List[Dict[str, Any]]):
+        """Write a JSON list file and keep its parsed copy current"""
+        try:
+            await _write_json_atomic(file_path, items)
+        except Exception:
+            # The cached list may already hold the unwritten items
+            self._cache.pop(file_path, None)
+            raise
+        self._cache[file_path] = (os.stat(file_path).st_mtime_ns, items)
+    
+    async def _append(self, file_path: str, items: List[Dict[str, Any]]):
+        """Append items to a JSON list file"""
+        if not self.connected:
+            await self.initialize()
+        
+        async with self._locks[file_path]:
+            # Read existing items
+            existing = await self._read(file_path)
+            
+            # Add new items
+            existing.extend(items)
+            
+            # Write back to file
+            await self._write(file_path, existing)
     
     async def initialize(self):
         """Initialize file store"""
@@ -35,63 +96,31 @@ class FileStore(BaseStore):
     
     async def store_content(self, content_item: Dict[str, Any]):
         """Store content item to file"""
-        if not self.connected:
-            await self.initialize()
-        
-        # Read existing content
-        async with aiofiles.open(self.content_file, 'r', encoding='utf-8') as f:
-            content = json.loads(await f.read())
-        
-        # Add new content
-        content.append(content_item)
-        
-        # Write back to file
-        async with aiofiles.open(self.content_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(content, ensure_ascii=False, indent=2))
+        await self._append(self.content_file, [content_item])
+    
+    async def store_contents(self, content_items: List[Dict[str, Any]]):
+        """Store a batch of content items to file"""
+        # Read and write the file once for the whole batch
+        await self._append(self.content_file, content_items)
     
     async def store_comment(self, comment_item: Dict[str, Any]):
         """Store comment item to file"""
-        if not self.connected:
-            await self.initialize()
-        
-        # Read existing comments
-        async with aiofiles.open(self.comments_file, 'r', encoding='utf-8') as f:
-            comments = json.loads(await f.read())
-        
-        # Add new comment
-        comments.append(comment_item)
-        
-        # Write back to file
-        async with aiofiles.open(self.comments_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(comments, ensure_ascii=False, indent=2))
+        await self._append(self.comments_file, [comment_item])
     
     async def store_creator(self, creator: Dict[str, Any]):
         """Store creator information to file"""
-        if not self.connected:
-            await self.initialize()
-        
-        # Read existing creators
-        async with aiofiles.open(self.creators_file, 'r', encoding='utf-8') as f:
-            creators = json.loads(await f.read())
-        
-        # Add new creator
-        creators.append(creator)
-        
-        # Write back to file
-        async with aiofiles.open(self.creators_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(creators, ensure_ascii=False, indent=2))
+        await self._append(self.creators_file, [creator])
     
     async def get_content_by_id(self, content_id: str) -> Optional[Dict[str, Any]]:
         """Get content by ID from file"""
         if not self.connected:
             await self.initialize()
         
-        async with aiofiles.open(self.content_file, 'r', encoding='utf-8') as f:
-            content = json.loads(await f.read())
+        content = await self._read(self.content_file)
         
         for item in content:
             if item.get('id') == content_id:
-                return item
+                return dict(item)
         return None
     
     async def get_comments_by_content_id(self, content_id: str) -> List[Dict[str, Any]]:
@@ -99,22 +128,20 @@ class FileStore(BaseStore):
         if not self.connected:
             await self.initialize()
         
-        async with aiofiles.open(self.comments_file, 'r', encoding='utf-8') as f:
-            comments = json.loads(await f.read())
+        comments = await self._read(self.comments_file)
         
-        return [comment for comment in comments if comment.get('content_id') == content_id]
+        return [dict(comment) for comment in comments if comment.get('content_id') == content_id]
     
     async def get_creator_by_id(self, creator_id: str) -> Optional[Dict[str, Any]]:
         """Get creator by ID from file"""
         if not self.connected:
             await self.initialize()
         
-        async with aiofiles.open(self.creators_file, 'r', encoding='utf-8') as f:
-            creators = json.loads(await f.read())
+        creators = await self._read(self.creators_file)
         
         for creator in creators:
             if creator.get('id') == creator_id:
-                return creator
+                return dict(creator)
         return None
     
     async def close(self):
@@ -230,6 +257,8 @@ class FileStoreImage(BaseStoreImage):
         super().__init__()
         self.output_dir = output_dir
         self.images_file = os.path.join(output_dir, "images.json")
+        # One read-append-write at a time, or concurrent appends are lost
+        self._lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize file store image"""
@@ -247,24 +276,24 @@ class FileStoreImage(BaseStoreImage):
         if not self.connected:
             await self.initialize()
         
-        # Read existing images
-        async with aiofiles.open(self.images_file, 'r', encoding='utf-8') as f:
-            images = json.loads(await f.read())
-        
-        # Add new image
-        images.append(image_content_item)
-        
-        # Write back to file
-        async with aiofiles.open(self.images_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(images, ensure_ascii=False, indent=2))
+        async with self._lock:
+            # Read existing images
+            async with aiofiles.open(self.images_file, 'rb') as f:
+                images = orjson.loads(await f.read())
+            
+            # Add new image
+            images.append(image_content_item)
+            
+            # Write back to file
+            await _write_json_atomic(self.images_file, images)
     
     async def get_image_by_id(self, image_id: str) -> Optional[Dict[str, Any]]:
         """Get image by ID from file"""
         if not self.connected:
             await self.initialize()
         
-        async with aiofiles.open(self.images_file, 'r', encoding='utf-8') as f:
-            images = json.loads(await f.read())
+        async with aiofiles.open(self.images_file, 'rb') as f:
+            images = orjson.loads(await f.read())
         
         for image in images:
             if image.get('id') == image_id:
@@ -283,6 +312,8 @@ class FileStoreVideo(BaseStoreVideo):
         super().__init__()
         self.output_dir = output_dir
         self.videos_file = os.path.join(output_dir, "videos.json")
+        # One read-append-write at a time, or concurrent appends are lost
+        self._lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize file store video"""
@@ -300,24 +331,24 @@ class FileStoreVideo(BaseStoreVideo):
         if not self.connected:
             await self.initialize()
         
-        # Read existing videos
-        async with aiofiles.open(self.videos_file, 'r', encoding='utf-8') as f:
-            videos = json.loads(await f.read())
-        
-        # Add new video
-        videos.append(video_content_item)
-        
-        # Write back to file
-        async with aiofiles.open(self.videos_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(videos, ensure_ascii=False, indent=2))
+        async with self._lock:
+            # Read existing videos
+            async with aiofiles.open(self.videos_file, 'rb') as f:
+                videos = orjson.loads(await f.read())
+            
+            # Add new video
+            videos.append(video_content_item)
+            
+            # Write back to file
+            await _write_json_atomic(self.videos_file, videos)
     
     async def get_video_by_id(self, video_id: str) -> Optional[Dict[str, Any]]:
         """Get video by ID from file"""
         if not self.connected:
             await self.initialize()
         
-        async with aiofiles.open(self.videos_file, 'r', encoding='utf-8') as f:
-            videos = json.loads(await f.read())
+        async with aiofiles.open(self.videos_file, 'rb') as f:
+            videos = orjson.loads(await f.read())
         
         for video in videos:
             if video.get('id') == video_id:
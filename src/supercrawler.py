@@ -5,8 +5,10 @@
 import sys
 import io
 import asyncio
+import logging
+import logging.handlers
 import scrapy
-from typing import Optional, Type, Dict, Any
+from typing import Optional
 
 # Force UTF-8 encoding for stdout/stderr to prevent encoding errors
 # when outputting Chinese characters in non-UTF-8 terminals
@@ -20,86 +22,37 @@ if sys.stderr and hasattr(sys.stderr, 'buffer'):
 import src.api.cli.commands as cmd_arg
 import src.config as config
 from src.core.base.base_crawler import AbstractCrawler
-from src.spiders.platforms.bilibili import BilibiliCrawler
-from src.spiders.platforms.douyin import DouYinCrawler
-from src.spiders.platforms.kuaishou import KuaishouCrawler
-from src.spiders.platforms.tieba import TieBaCrawler
-from src.spiders.platforms.weibo import WeiboCrawler
-from src.spiders.platforms.xhs import XiaoHongShuCrawler
-from src.spiders.platforms.zhihu import ZhihuCrawler
-from src.spiders.platforms.facebook import FacebookCrawler
-from src.spiders.platforms.twitter import TwitterCrawler
-from src.spiders.platforms.instagram import InstagramCrawler
-from src.spiders.platforms.youtube import YoutubeCrawler
+from src.spiders.factory import CrawlerFactory
 from src.utils.async_file_writer import AsyncFileWriter
 from src.utils.app_runner import run
-from src.monitoring.monitor import Monitor
+from src.monitoring.monitor import Monitor, ensure_monitor_started
 from src.scheduler.scheduler import Scheduler
 
 
-class CrawlerFactory:
-    """Crawler factory for creating platform-specific crawlers"""
-    
-    CRAWLERS: Dict[str, Type[AbstractCrawler]] = {
-        # Chinese platforms
-        "xhs": XiaoHongShuCrawler,
-        "dy": DouYinCrawler,
-        "ks": KuaishouCrawler,
-        "bili": BilibiliCrawler,
-        "wb": WeiboCrawler,
-        "tieba": TieBaCrawler,
-        "zhihu": ZhihuCrawler,
-        # International platforms
-        "facebook": FacebookCrawler,
-        "twitter": TwitterCrawler,
-        "instagram": InstagramCrawler,
-        "youtube": YoutubeCrawler,
-    }
-    
-    @staticmethod
-    def create_crawler(platform: str) -> AbstractCrawler:
-        """Create a crawler for the specified platform"""
-        crawler_class = CrawlerFactory.CRAWLERS.get(platform)
-        if not crawler_class:
-            supported = ", ".join(sorted(CrawlerFactory.CRAWLERS))
-            raise ValueError(f"Invalid media platform: {platform!r}. Supported: {supported}")
-        return crawler_class()
-    
-    @staticmethod
-    def get_supported_platforms() -> Dict[str, Dict[str, Any]]:
-        """Get list of supported platforms with their features"""
-        platforms = {}
-        for platform_code, crawler_class in CrawlerFactory.CRAWLERS.items():
-            try:
-                crawler = crawler_class()
-                platforms[platform_code] = {
-                    "name": crawler.get_platform_name(),
-                    "features": crawler.get_supported_features(),
-                    "enabled": True
-                }
-            except Exception:
-                platforms[platform_code] = {
-                    "name": platform_code.capitalize(),
-                    "features": [],
-                    "enabled": False
-                }
-        return platforms
-    
-    @staticmethod
-    def is_platform_supported(platform: str) -> bool:
-        """Check if a platform is supported"""
-        return platform in CrawlerFactory.CRAWLERS
-    
-    @staticmethod
-    def get_platform_crawler_class(platform: str) -> Optional[Type[AbstractCrawler]]:
-        """Get crawler class for a specific platform"""
-        return CrawlerFactory.CRAWLERS.get(platform)
-
-
 crawler: Optional[AbstractCrawler] = None
 monitor: Optional[Monitor] = None
 scheduler: Optional[Scheduler] = None
 
+logger = logging.getLogger("supercrawler.main")
+
+
+def _setup_logging() -> None:
+    """Set up buffered logging for the crawler process"""
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("[%(name)s] %(levelname)s: %(message)s"))
+    
+    # Buffer DEBUG chatter and write it in bursts; INFO and above flush
+    # immediately so progress output is never held back
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=100,
+        flushLevel=logging.INFO,
+        target=stream_handler
+    )
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(memory_handler)
+    root_logger.setLevel(logging.DEBUG if config.base_config.DEBUG else logging.INFO)
+
 
 async def _flush_excel_if_needed() -> None:
     """Flush Excel data if needed"""
@@ -109,9 +62,9 @@ async def _flush_excel_if_needed() -> None:
     try:
         from store.excel_store_base import ExcelStoreBase
         ExcelStoreBase.flush_all()
-        print("[Main] Excel files saved successfully")
+        logger.info("Excel files saved successfully")
     except Exception as e:
-        print(f"[Main] Error flushing Excel data: {e}")
+        logger.error("Error flushing Excel data: %s", e)
 
 
 async def _generate_wordcloud_if_needed() -> None:
@@ -126,27 +79,24 @@ async def _generate_wordcloud_if_needed() -> None:
         )
         await file_writer.generate_wordcloud_from_comments()
     except Exception as e:
-        print(f"[Main] Error generating wordcloud: {e}")
+        logger.error("Error generating wordcloud: %s", e)
 
 
 async def _initialize_monitoring() -> None:
     """Initialize monitoring system"""
     global monitor
     if config.base_config.ENABLE_MONITORING:
-        from src.monitoring.monitor import Monitor
-        monitor = Monitor()
-        await monitor.initialize()
-        print("[Main] Monitoring system initialized")
+        monitor = await ensure_monitor_started()
+        logger.info("Monitoring system initialized")
 
 
 async def _initialize_scheduler() -> None:
     """Initialize scheduler system"""
     global scheduler
     if config.base_config.ENABLE_SCHEDULER:
-        from src.scheduler.scheduler import Scheduler
         scheduler = Scheduler()
         await scheduler.initialize()
-        print("[Main] Scheduler system initialized")
+        logger.info("Scheduler system initialized")
 
 
 async def _cleanup_resources() -> None:
@@ -161,7 +111,7 @@ async def _cleanup_resources() -> None:
             except Exception as e:
                 error_msg = str(e).lower()
                 if "closed" not in error_msg and "disconnected" not in error_msg:
-                    print(f"[Main] Error cleaning up CDP browser: {e}")
+                    logger.error("Error cleaning up CDP browser: %s", e)
         
         elif hasattr(crawler, "browser_context"):
             try:
@@ -169,21 +119,21 @@ async def _cleanup_resources() -> None:
             except Exception as e:
                 error_msg = str(e).lower()
                 if "closed" not in error_msg and "disconnected" not in error_msg:
-                    print(f"[Main] Error closing browser context: {e}")
+                    logger.error("Error closing browser context: %s", e)
     
     # Cleanup monitoring
     if monitor:
         try:
             await monitor.cleanup()
         except Exception as e:
-            print(f"[Main] Error cleaning up monitor: {e}")
+            logger.error("Error cleaning up monitor: %s", e)
     
     # Cleanup scheduler
     if scheduler:
         try:
             await scheduler.cleanup()
         except Exception as e:
-            print(f"[Main] Error cleaning up scheduler: {e}")
+            logger.error("Error cleaning up scheduler: %s", e)
     
     # Cleanup database connections
     if config.base_config.SAVE_DATA_OPTION in ("db", "sqlite", "mongodb"):
@@ -191,7 +141,7 @@ async def _cleanup_resources() -> None:
             from src.storage.database.db import close
             await close()
         except Exception as e:
-            print(f"[Main] Error closing database connections: {e}")
+            logger.error("Error closing database connections: %s", e)
 
 
 async def main() -> None:
@@ -199,7 +149,10 @@ async def main() -> None:
     global crawler
     
     # Parse command-line arguments
-    args = await cmd_arg.parse_cmd()
+    args = cmd_arg.get_args()
+    
+    # Set up logging once the debug flag is known
+    _setup_logging()
     
     # Initialize monitoring
     await _initialize_monitoring()
@@ -209,22 +162,25 @@ async def main() -> None:
     
     # Handle database initialization
     if args.init_db:
+        from src.storage.database.db import init_db, close
         try:
-            from src.storage.database.db import init_db
             await init_db(args.init_db)
-            print(f"Database {args.init_db} initialized successfully.")
+            logger.info("Database %s initialized successfully", args.init_db)
         except Exception as e:
-            print(f"Error initializing database: {e}")
+            logger.exception("Error initializing database: %s", e)
+        finally:
+            # Release the connection, or its worker thread keeps the process alive
+            await close()
         return
     
     # Create crawler
     platform = config.base_config.PLATFORM
-    print(f"[Main] Creating crawler for platform: {platform}")
+    logger.info("Creating crawler for platform: %s", platform)
     
     try:
         crawler = CrawlerFactory.create_crawler(platform=platform)
-        print(f"[Main] Created crawler: {crawler.get_platform_name()}")
-        print(f"[Main] Supported features: {', '.join(crawler.get_supported_features())}")
+        logger.info("Created crawler: %s", crawler.get_platform_name())
+        logger.info("Supported features: %s", ", ".join(crawler.get_supported_features()))
         
         # Start crawler
         await crawler.start()
@@ -236,9 +192,7 @@ async def main() -> None:
         await _generate_wordcloud_if_needed()
         
     except Exception as e:
-        print(f"[Main] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error: %s", e)
     finally:
         # Cleanup resources
         await _cleanup_resources()
@@ -3,7 +3,13 @@
 # Licensed under NON-COMMERCIAL LEARNING LICENSE 1.1
 
 import asyncio
+import os
+import sys
+import tempfile
+from unittest import mock
+import orjson
 import pytest
+from src.api.cli.commands import get_arg_dict, parse_cmd
 from src.spiders.factory import CrawlerFactory
 from src.storage.factory import StoreFactory
 from src.monitoring.monitor import Monitor
@@ -36,6 +42,43 @@ class TestStoreFactory:
         await store.initialize()
         assert store is not None
         await store.close()
+    
+    async def test_file_store_concurrent_writes(self):
+        """Test overlapping writes to a shared file store"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            store = StoreFactory.create_store("file", output_dir=output_dir)
+            await store.initialize()
+            await asyncio.gather(*(store.store_content({"id": str(i)}) for i in range(50)))
+            
+            with open(store.content_file, 'rb') as f:
+                content = orjson.loads(f.read())
+            assert sorted(item["id"] for item in content) == sorted(str(i) for i in range(50))
+            # No temp files are left behind
+            assert sorted(os.listdir(output_dir)) == ["comments.json", "content.json", "creators.json"]
+            await store.close()
+    
+    async def test_sqlite_store_concurrent_transactions(self):
+        """Test that a rolled-back transaction doesn't take other tasks' writes with it"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            store = StoreFactory.create_store("sqlite", db_path=os.path.join(output_dir, "test.db"))
+            await store.initialize()
+            
+            async def failing_batch():
+                async with store.transaction():
+                    await store.store_content({"id": "a"})
+                    await asyncio.sleep(0)
+                    raise RuntimeError("abort batch")
+            
+            results = await asyncio.gather(
+                failing_batch(),
+                store.store_contents([{"id": "b"}, {"id": "c"}]),
+                return_exceptions=True
+            )
+            assert isinstance(results[0], RuntimeError)
+            assert await store.get_content_by_id("a") is None
+            assert await store.get_content_by_id("b") is not None
+            assert await store.get_content_by_id("c") is not None
+            await store.close()
 
 
 class TestMonitor:
@@ -65,15 +108,60 @@ class TestMonitor:
         assert "status" in health
         
         await monitor.cleanup()
+    
+    async def test_avg_response_time(self):
+        """Test average response time"""
+        monitor = Monitor()
+        for response_time in (0.1, 0.2, 0.6):
+            await monitor.log_event("success", {"url": "https://example.com", "response_time": response_time})
+        # Successes without timing don't skew the mean
+        await monitor.log_event("success", {"url": "https://example.com"})
+        
+        snapshot = monitor.snapshot()
+        assert snapshot.successes == 4
+        assert snapshot.avg_response_time == pytest.approx(0.3)
+
+
+class TestCommands:
+    """Test command-line helpers"""
+    
+    def test_get_arg_dict(self):
+        """Test get arg dict"""
+        expected = {
+            "platform": "xhs", "crawler_type": "search", "query": "food",
+            "content_id": None, "user_id": None, "max_results": 100,
+            "output": None, "init_db": None, "use_proxy": False,
+            "proxy_provider": "none", "proxy_api_key": None, "headless": True,
+            "use_cdp": False, "login_type": "cookie", "cookies_file": None,
+            "request_interval": 1.0, "max_requests_per_minute": 60,
+            "save_data_option": "json", "debug": False, "verbose": 0,
+            "enable_monitoring": True, "enable_scheduler": True
+        }
+        # Parse a real command line; only the query has no default
+        argv = ["supercrawler", "--query", "food"]
+        with mock.patch.object(sys, "argv", argv), \
+                mock.patch("src.api.cli.commands._update_config"):
+            args = parse_cmd()
+        arg_dict = get_arg_dict(args)
+        assert arg_dict == expected
+        
+        # The result is a copy, not the namespace's own __dict__
+        arg_dict["platform"] = "dy"
+        assert args.platform == "xhs"
 
 
 if __name__ == "__main__":
     """Run tests"""
     asyncio.run(TestMonitor().test_monitor())
+    asyncio.run(TestMonitor().test_avg_response_time())
     asyncio.run(TestStoreFactory().test_create_store())
+    asyncio.run(TestStoreFactory().test_file_store_concurrent_writes())
+    asyncio.run(TestStoreFactory().test_sqlite_store_concurrent_transactions())
     
     test_factory = TestCrawlerFactory()
     test_factory.test_get_supported_platforms()
     test_factory.test_create_crawler()
     
+    TestCommands().test_get_arg_dict()
+    
     print("All tests passed!")
\ No newline at end of file